@@ -154,7 +154,7 @@ class ExchangeConnector:
 ```
 """
 
-from .reliability_manager import ReliabilityManager, ReliabilityConfig
+from .reliability_manager import ReliabilityManager, ReliabilityConfig, StatusSnapshot
 
 # Singleton accessor for global reliability manager used by guards
 _global_reliability_manager: ReliabilityManager = None
@@ -171,7 +171,8 @@ def set_reliability_manager(instance: ReliabilityManager):
 
 __all__ = [
     "ReliabilityManager",
-    "ReliabilityConfig"
+    "ReliabilityConfig",
+    "StatusSnapshot"
 ]
 
 # Helper decorator to enforce readiness/rate-limit gate on order entry
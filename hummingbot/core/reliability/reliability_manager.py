@@ -3,7 +3,8 @@ Reliability Manager - Unified coordinator for all reliability and limits feature
 """
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Callable
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Callable, Tuple
 
 from hummingbot.core.api_throttler.token_bucket_rate_limiter import EnhancedRateLimiter
 from hummingbot.core.utils.time_sync_monitor import TimeSyncMonitor
@@ -52,6 +53,15 @@ class ReliabilityConfig:
         self.health_endpoint_host = "127.0.0.1"
 
 
+@dataclass
+class StatusSnapshot:
+    """Lightweight status summary for periodic status printing."""
+    ready: bool
+    drift_ms: float
+    can_trade: bool
+    rate_limits: List[Tuple[str, int, int]] = field(default_factory=list)
+
+
 class ReliabilityManager:
     """
     Unified reliability manager coordinating all reliability and limits features.
@@ -444,6 +454,24 @@ class ReliabilityManager:
 
         return status
 
+    def get_status_snapshot(self) -> StatusSnapshot:
+        """
+        Get a compact status summary without walking drift statistics or readiness health checks.
+
+        Use this for frequent status prints; use get_comprehensive_status() for full diagnostics.
+        """
+        rate_limits = []
+        if self.rate_limiter:
+            for exchange, info in self.rate_limiter.get_all_statuses().items():
+                rate_limits.append((exchange, int(info["tokens_available"]), int(info["capacity"])))
+
+        return StatusSnapshot(
+            ready=self.is_trading_ready(),
+            drift_ms=self.get_time_drift_ms(),
+            can_trade=self.circuit_breaker_manager.can_trade() if self.circuit_breaker_manager else True,
+            rate_limits=rate_limits
+        )
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.start()
@@ -237,28 +237,16 @@ async def print_status_updates(reliability_manager: ReliabilityManager, simulato
     while True:
         await asyncio.sleep(30)  # Print status every 30 seconds
         
-        # Get comprehensive status
-        status = reliability_manager.get_comprehensive_status()
+        # Get lightweight status snapshot and emit a single log record
+        snap = reliability_manager.get_status_snapshot()
         stats = simulator.get_stats()
-        
-        logger.info("📈 === STATUS UPDATE ===")
-        logger.info(f"Overall Ready: {status['overall_ready']}")
-        logger.info(f"Trades: {stats['total_trades']}, Errors: {stats['total_errors']}, Success Rate: {stats['success_rate']:.1f}%")
-        
-        if reliability_manager.time_sync_monitor:
-            drift = reliability_manager.get_time_drift_ms()
-            logger.info(f"Time Drift: {drift:.1f}ms")
-        
-        # Circuit breaker status
-        if "circuit_breakers" in status["components"]:
-            cb_status = status["components"]["circuit_breakers"]
-            logger.info(f"Circuit Breakers - Can Trade: {cb_status['can_trade']}")
-        
-        # Rate limiter status
-        if "rate_limiter" in status["components"]:
-            rl_status = status["components"]["rate_limiter"]
-            for exchange, info in rl_status.items():
-                logger.info(f"Rate Limit {exchange}: {info['tokens_available']:.0f}/{info['capacity']} tokens")
+
+        logger.info(
+            "📈 STATUS ready=%s drift=%.1fms can_trade=%s trades=%d errors=%d success=%.1f%% %s",
+            snap.ready, snap.drift_ms, snap.can_trade,
+            stats['total_trades'], stats['total_errors'], stats['success_rate'],
+            " ".join(f"{e}:{t}/{c}" for e, t, c in snap.rate_limits)
+        )
 
 
 if __name__ == "__main__":
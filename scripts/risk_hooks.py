@@ -21,17 +21,22 @@ class RiskWrappedFundingArb(FundingRateArbStrategy):
     def __init__(self, connectors: Dict[str, ConnectorBase], config: FundingRateArbitrageConfig):
         super().__init__(connectors, config)
         self._day_start_ts = self.current_timestamp
+        self._ws_last_recv_getters = None
 
     def on_tick(self):
+        # Read the clock once per tick and share it with both risk checks
+        now = self.current_timestamp
         super().on_tick()
-        self._check_stop_loss()
-        self._check_ws_latency()
+        self._check_stop_loss(now)
+        self._check_ws_latency(now)
 
-    def _reset_day_if_needed(self):
-        current_day = datetime.utcfromtimestamp(self.current_timestamp).date()
+    def _reset_day_if_needed(self, now: float | None = None):
+        if now is None:
+            now = self.current_timestamp
+        current_day = datetime.utcfromtimestamp(now).date()
         start_day = datetime.utcfromtimestamp(self._day_start_ts).date()
         if current_day != start_day:
-            self._day_start_ts = self.current_timestamp
+            self._day_start_ts = now
 
     def _aggregate_realized_pnl(self) -> Decimal:
         realized = Decimal("0")
@@ -41,8 +46,8 @@ class RiskWrappedFundingArb(FundingRateArbStrategy):
                 realized += report.realized_pnl_quote
         return realized
 
-    def _check_stop_loss(self):
-        self._reset_day_if_needed()
+    def _check_stop_loss(self, now: float | None = None):
+        self._reset_day_if_needed(now)
         realized = self._aggregate_realized_pnl()
         if realized >= self.DAILY_PROFIT_LIMIT_USD:
             self.logger().info("Daily profit limit reached. Stopping strategy.")
@@ -51,20 +56,53 @@ class RiskWrappedFundingArb(FundingRateArbStrategy):
             self.logger().info("Daily loss limit reached. Stopping strategy.")
             HummingbotApplication.main_application().stop()
 
-    def _check_ws_latency(self):
-        threshold = self.WS_LATENCY_LIMIT_SEC
+    def _bind_ws_last_recv_getters(self):
+        """
+        Bind a last_recv_time getter per connector with a user stream. The getters are cached only when every
+        connector could be bound; otherwise the skipped connectors are probed again on the next tick.
+        """
+        getters = []
+        skipped = False
         for name, connector in self.connectors.items():
             try:
-                last = connector.user_stream_tracker.data_source.last_recv_time
+                tracker = connector.user_stream_tracker
+                tracker.data_source.last_recv_time
             except (AttributeError, TypeError) as e:
                 # Connector may not have user stream tracker or data source
                 self.logger().debug(f"Could not check WS latency for {name}: {e}")
+                skipped = True
+                continue
+            except Exception as e:
+                # Log unexpected errors but continue checking other connectors
+                self.logger().warning(f"Unexpected error checking WS latency for {name}: {e}")
+                skipped = True
+                continue
+            getters.append((name, lambda t=tracker: t.data_source.last_recv_time))
+        self._ws_last_recv_getters = None if skipped else getters
+        return getters
+
+    def _check_ws_latency(self, now: float | None = None):
+        getters = self._ws_last_recv_getters
+        if getters is None:
+            getters = self._bind_ws_last_recv_getters()
+        # last_recv_time is stamped with wall-clock time, so compare against the tick timestamp
+        if now is None:
+            now = self.current_timestamp
+        threshold = self.WS_LATENCY_LIMIT_SEC
+        for name, get in getters:
+            try:
+                last = get()
+                is_stale = last > 0 and now - last > threshold
+            except (AttributeError, TypeError) as e:
+                # The stream tracker or its data source was swapped out (e.g. on reconnect); rebind next tick
+                self.logger().debug(f"Could not check WS latency for {name}: {e}")
+                self._ws_last_recv_getters = None
                 continue
             except Exception as e:
                 # Log unexpected errors but continue checking other connectors
                 self.logger().warning(f"Unexpected error checking WS latency for {name}: {e}")
                 continue
-            if last > 0 and self.current_timestamp - last > threshold:
+            if is_stale:
                 self.logger().warning(f"WebSocket latency on {name} over {threshold}s. Stopping strategy.")
                 HummingbotApplication.main_application().stop()
-                break
+                return
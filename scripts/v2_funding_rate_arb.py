@@ -1,8 +1,13 @@
 import csv
+import logging
 import os
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from itertools import islice
 from decimal import Decimal
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import Dict, List, Set, Tuple
 
 import pandas as pd
 from pydantic import Field, field_validator
@@ -21,6 +26,45 @@ from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction,
 # Critical production utilities
 from utils import TelegramAlerter, get_rate_limiter
 
+# Decimal constants used on every tick; parsing them once avoids repeated string->Decimal conversion
+_D_ZERO = Decimal("0")
+_D_095 = Decimal("0.95")  # Position size share of leveraged balance, leaves buffer for fees
+_D_BUFFER = Decimal("1.10")  # 10% margin buffer on top of required margin
+_D_FEE_FALLBACK = Decimal("0.001")  # Conservative taker fee estimate
+_D_UNPROFITABLE = Decimal("-999")  # Sentinel profitability that makes an opportunity get skipped
+_D_HUNDRED = Decimal("100")
+_D_MIN_DAILY_DIFF = Decimal("0.0001")  # Below this daily rate diff, days-to-profit is shown as infinite
+_PAIR_SEPARATORS = ("-", "/", "_")  # Trading pair separators, in the order they are tried
+
+
+def _to_decimal(value) -> Decimal:
+    """Return value as a Decimal, skipping the str round-trip when it already is one."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+@dataclass(slots=True)
+class StoppedArbitrage:
+    """Compact record of a fully closed arbitrage kept in the per-token history."""
+    connector_1: str
+    connector_2: str
+    side: TradeType
+    position_size_quote: Decimal | None
+    close_reason: str
+    close_timestamp: float | None
+    pnl_quote: float
+
+    @classmethod
+    def from_closing_info(cls, closing_info: dict, pnl_quote: float) -> "StoppedArbitrage":
+        return cls(
+            connector_1=closing_info["connector_1"],
+            connector_2=closing_info["connector_2"],
+            side=closing_info.get("side"),
+            position_size_quote=closing_info.get("position_size_quote"),
+            close_reason=closing_info.get("close_reason", "Closed"),
+            close_timestamp=closing_info.get("close_timestamp"),
+            pnl_quote=pnl_quote,
+        )
+
 
 class FundingRateArbitrageConfig(StrategyV2ConfigBase):
     script_file_name: str = os.path.basename(__file__)
@@ -210,7 +254,8 @@ class FundingRateArbitrageConfig(StrategyV2ConfigBase):
 
 
 class FundingRateArbitrage(StrategyV2Base):
-    quote_markets_map = {
+    # Static exchange metadata, read-only so per-tick lookups can never mutate it
+    quote_markets_map = MappingProxyType({
         "hyperliquid_perpetual": "USD",
         "binance_perpetual": "USDT",
         "bybit_perpetual": "USDT",
@@ -221,8 +266,8 @@ class FundingRateArbitrage(StrategyV2Base):
         "bitget_perpetual": "USDT",
         "mexc_perpetual": "USDT",
         "phemex_perpetual": "USDT",
-    }
-    funding_payment_interval_map = {
+    })
+    funding_payment_interval_map = MappingProxyType({
         "binance_perpetual": 60 * 60 * 8,  # 8 hours
         "bybit_perpetual": 60 * 60 * 8,    # 8 hours
         "okx_perpetual": 60 * 60 * 8,      # 8 hours
@@ -233,34 +278,102 @@ class FundingRateArbitrage(StrategyV2Base):
         "mexc_perpetual": 60 * 60 * 8,     # 8 hours
         "phemex_perpetual": 60 * 60 * 8,   # 8 hours
         "hyperliquid_perpetual": 60 * 60 * 1,  # 1 hour
-    }
+    })
+    _interval_decimal_map = MappingProxyType(
+        {name: Decimal(interval) for name, interval in funding_payment_interval_map.items()}
+    )
     # Exchanges that only support ONEWAY position mode (most support HEDGE)
-    oneway_only_exchanges = {
+    oneway_only_exchanges = frozenset({
         "hyperliquid_perpetual",
         # Add other ONEWAY-only exchanges here if needed
-    }
+    })
     funding_profitability_interval = 60 * 60 * 24
+    # (token, connector) -> trading pair, filled in init_markets
+    _trading_pair_cache: Dict[Tuple[str, str], str] = {}
+    # trading pair -> (base, quote), filled alongside _trading_pair_cache
+    _pair_parts: Dict[str, Tuple[str, str]] = {}
+    # Seconds a rendered status is reused for repeated status polls
+    _STATUS_TTL = 1.0
+    # Seconds a cached fee percent is trusted before the connector is asked again (fee tiers can change)
+    _FEE_CACHE_TTL = 60.0
 
     @classmethod
     def get_trading_pair_for_connector(cls, token, connector):
-        return f"{token}-{cls.quote_markets_map.get(connector, 'USDT')}"
+        trading_pair = cls._trading_pair_cache.get((token, connector))
+        if trading_pair is None:
+            quote = cls.quote_markets_map.get(connector, "USDT")
+            trading_pair = f"{token}-{quote}"
+            cls._trading_pair_cache[(token, connector)] = trading_pair
+            cls._pair_parts[trading_pair] = (token, quote)
+        return trading_pair
 
     @classmethod
     def init_markets(cls, config: FundingRateArbitrageConfig):
         markets = {}
-        for connector in config.connectors:
-            trading_pairs = {cls.get_trading_pair_for_connector(token, connector) for token in config.tokens}
+        cls._trading_pair_cache = {}
+        cls._pair_parts = {}
+        tokens = sorted(config.tokens)
+        for connector in sorted(config.connectors):
+            quote = cls.quote_markets_map.get(connector, "USDT")
+            trading_pairs = set()
+            for token in tokens:
+                trading_pair = f"{token}-{quote}"
+                cls._trading_pair_cache[(token, connector)] = trading_pair
+                cls._pair_parts[trading_pair] = (token, quote)
+                trading_pairs.add(trading_pair)
             markets[connector] = trading_pairs
         cls.markets = markets
 
     def __init__(self, connectors: Dict[str, ConnectorBase], config: FundingRateArbitrageConfig):
         super().__init__(connectors, config)
         self.config = config
+        # Sorted snapshots of the configured sets for deterministic iteration on every tick
+        self._tokens_tuple = tuple(sorted(self.config.tokens))
+        self._connectors_tuple = tuple(sorted(self.config.connectors))
+        self._connectors_set = set(self.config.connectors)  # read-only, copied by get_available_connectors
+        # Float mirrors of the Decimal thresholds used by the slippage, depth and hedge checks
+        self._max_slippage_pct_f = float(self.config.max_slippage_pct)
+        self._depth_multiplier_f = float(self.config.min_order_book_depth_multiplier)
+        self._max_imbalance_pct_f = float(self.config.max_position_imbalance_pct)
+        # Quote currency and funding interval of each configured connector, resolved once
+        self._quote_by_connector = {
+            connector: self.quote_markets_map.get(connector, "USDT") for connector in self._connectors_tuple
+        }
+        self._funding_interval_by_connector = {
+            connector: self.funding_payment_interval_map.get(connector, 60 * 60 * 8) for connector in self._connectors_tuple
+        }
+        # connector -> trading pairs it can report funding info for, probed once so unsupported
+        # pairs are skipped instead of raising on every tick
+        self._supports_funding_info: Dict[str, Set[str]] = {}
+        for connector_name, connector in self.connectors.items():
+            if not hasattr(connector, "get_funding_info"):
+                continue
+            trading_pairs = getattr(connector, "trading_pairs", None) or self.markets.get(connector_name, set())
+            self._supports_funding_info[connector_name] = set(trading_pairs)
         self.active_funding_arbitrages = {}
         self.pending_funding_arbitrages = {}  # NEW: positions awaiting validation
-        self.stopped_funding_arbitrages = {token: [] for token in self.config.tokens}
+        # Bounded histories: last 10 closed arbitrages per token, last 100 funding payments per position
+        self.stopped_funding_arbitrages = {token: deque(maxlen=10) for token in self.config.tokens}
         self.pending_validation_max_attempts = 3
         self.initial_balances = {}
+        # (connector, base, quote, is_maker, position_action, side) -> (cached at, fee percent), see get_cached_fee
+        self._fee_cache: Dict[tuple, Tuple[float, Decimal]] = {}
+        # (connector, trading_pair, price_type) -> price and (connector, currency) -> available balance,
+        # both valid for the tick in _tick_price_cache_ts
+        self._tick_price_cache: Dict[tuple, Decimal] = {}
+        self._tick_balance_cache: Dict[Tuple[str, str], Decimal] = {}
+        self._tick_price_cache_ts = None
+        # executor id -> executor for the controller_reports object in _executor_by_id_reports
+        self._executor_by_id = {}
+        self._executor_by_id_reports = None
+        # Per-tick funding snapshot: token -> funding info report and (token, connector) -> normalized rate
+        self._tick_funding_snapshot: Dict[str, Dict] = {}
+        self._tick_normalized_rates: Dict[Tuple[str, str], Decimal | None] = {}
+        self._tick_funding_ts = None
+        # token -> (leg notionals, verdict) of the last hedge check of an active position
+        self._hedge_cache: Dict[str, Tuple[Tuple[Decimal, Decimal], Tuple[bool, str]]] = {}
+        # (connector, ..., reason) -> timestamp of the last warning emitted through _warn_once
+        self._warn_debounce: Dict[tuple, float] = {}
 
         # Initialize Telegram alerter for critical event monitoring
         bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -272,7 +385,7 @@ class FundingRateArbitrage(StrategyV2Base):
 
         # Track errors for high error rate alerting
         self.error_count = 0
-        self.last_error_reset = None
+        self.last_error_reset = time.monotonic()
 
         # BUG FIX #20: Track last statistics logging time
         self.last_stats_log_time = None
@@ -281,6 +394,23 @@ class FundingRateArbitrage(StrategyV2Base):
         # Track positions that are closing and require confirmation
         self.closing_funding_arbitrages = {}
 
+        # Positions per connector across pending, active and closing arbitrages, maintained incrementally:
+        # a position is counted from the moment it becomes pending until its closing entry is removed
+        self._connector_refcount: Dict[str, int] = defaultdict(int)
+        # Connectors that reached max_positions_per_connector
+        self._connectors_in_use: Set[str] = set()
+
+        # Funding only settles every few hours, so after a completed scan opportunities are rescanned at most
+        # once per 1/60th of the shortest funding interval among the configured connectors (60s for 1h funding),
+        # see _complete_scan
+        self._scan_interval = min(
+            self._funding_interval_by_connector.values(),
+            default=60 * 60 * 8
+        ) / 60
+        self._next_scan_ts = 0
+        # Rendered status text, reused while polled within _STATUS_TTL and the open positions are unchanged
+        self._status_cache: Tuple[float, Tuple[str, ...], str] | None = None
+
         # Demo metrics tracking
         self.demo_metrics_enabled = bool(self.config.demo_mode and self.config.demo_metrics_enabled)
         self.demo_run_id = self._sanitize_run_id(self.config.demo_run_id)
@@ -291,10 +421,10 @@ class FundingRateArbitrage(StrategyV2Base):
         else:
             self.demo_metrics_file = os.path.join("logs", f"demo_metrics_{self.demo_run_id}.csv")
         self.demo_metrics_interval_seconds = max(1, self.config.demo_metrics_interval_seconds)
-        self.demo_start_balance = Decimal(str(self.config.demo_account_balance_quote)) if self.config.demo_mode else Decimal("0")
-        self.demo_realized_pnl = Decimal("0")
+        self.demo_start_balance = Decimal(str(self.config.demo_account_balance_quote)) if self.config.demo_mode else _D_ZERO
+        self.demo_realized_pnl = _D_ZERO
         self.demo_max_equity = None
-        self.demo_max_drawdown = Decimal("0")
+        self.demo_max_drawdown = _D_ZERO
         self.demo_last_metrics_ts = None
 
     def start(self, clock: Clock, timestamp: float) -> None:
@@ -304,72 +434,72 @@ class FundingRateArbitrage(StrategyV2Base):
         :param timestamp: Current time.
         """
         self._last_timestamp = timestamp
-
-        # BUG FIX #20: Add comprehensive startup logging
-        self.logger().info("=" * 80)
-        self.logger().info(" FUNDING RATE ARBITRAGE BOT STARTING")
-        self.logger().info("=" * 80)
-        self.logger().info(f" Timestamp: {timestamp}")
-        self.logger().info(f" Configuration:")
-        self.logger().info(f"   - Connectors: {', '.join(sorted(self.config.connectors))}")
-        self.logger().info(f"   - Tokens: {', '.join(sorted(self.config.tokens))}")
-        self.logger().info(f"   - Leverage: {self.config.leverage}x")
-        self.logger().info(f"   - Min funding rate: {self.config.min_funding_rate_profitability:.4%}")
+        self._fee_cache.clear()
+
+        # BUG FIX #20: Add comprehensive startup logging (emitted as one multi-line record)
+        lines = [
+            "=" * 80,
+            " FUNDING RATE ARBITRAGE BOT STARTING",
+            "=" * 80,
+            f" Timestamp: {timestamp}",
+            " Configuration:",
+            f"   - Connectors: {', '.join(sorted(self.config.connectors))}",
+            f"   - Tokens: {', '.join(sorted(self.config.tokens))}",
+            f"   - Leverage: {self.config.leverage}x",
+            f"   - Min funding rate: {self.config.min_funding_rate_profitability:.4%}",
+        ]
         if self.config.position_size_quote_pct > 0:
             if self.config.max_positions_per_connector > 0:
                 per_position_pct = self.config.position_size_quote_pct / Decimal(str(self.config.max_positions_per_connector))
-                self.logger().info(
+                lines.append(
                     f"   - Position size budget: {self.config.position_size_quote_pct:.0%} of initial balance split across "
                     f"{self.config.max_positions_per_connector} positions ({per_position_pct:.4%} per position)"
                 )
             else:
-                self.logger().info(
+                lines.append(
                     f"   - Position size: {self.config.position_size_quote_pct:.0%} of initial balance per connector"
                 )
             if self.config.position_size_quote > 0:
-                self.logger().info(f"   - Position size cap: ${self.config.position_size_quote}")
+                lines.append(f"   - Position size cap: ${self.config.position_size_quote}")
         else:
-            self.logger().info(f"   - Position size: ${self.config.position_size_quote}")
-        self.logger().info(f"   - Max slippage: {self.config.max_slippage_pct:.2%}")
-        self.logger().info(f"   - Rate limit blocking: {self.config.rate_limit_blocking}")
-        self.logger().info(f"   - Min time to funding: {self.config.min_time_to_next_funding_seconds}s")
-        self.logger().info(f"   - Order book depth check: {self.config.check_order_book_depth_enabled}")
+            lines.append(f"   - Position size: ${self.config.position_size_quote}")
+        lines.append(f"   - Max slippage: {self.config.max_slippage_pct:.2%}")
+        lines.append(f"   - Rate limit blocking: {self.config.rate_limit_blocking}")
+        lines.append(f"   - Min time to funding: {self.config.min_time_to_next_funding_seconds}s")
+        lines.append(f"   - Order book depth check: {self.config.check_order_book_depth_enabled}")
         if self.config.check_order_book_depth_enabled:
-            self.logger().info(f"   - Min order book depth: {self.config.min_order_book_depth_multiplier}x position size")
+            lines.append(f"   - Min order book depth: {self.config.min_order_book_depth_multiplier}x position size")
         if self.config.max_positions_per_connector > 0:
-            self.logger().info(f"   - Max positions per connector: {self.config.max_positions_per_connector}")
+            lines.append(f"   - Max positions per connector: {self.config.max_positions_per_connector}")
         else:
-            self.logger().info("   - Max positions per connector: unlimited")
-        self.logger().info(f"   - Position validation: {self.config.position_validation_enabled}")
-        self.logger().info(f"   - Pending validation timeout: {self.config.pending_validation_timeout_seconds}s")
-        self.logger().info(f"   - Emergency close on imbalance: {self.config.emergency_close_on_imbalance}")
-        self.logger().info(f"   - Max position imbalance: {self.config.max_position_imbalance_pct:.1%}")
+            lines.append("   - Max positions per connector: unlimited")
+        lines.append(f"   - Position validation: {self.config.position_validation_enabled}")
+        lines.append(f"   - Pending validation timeout: {self.config.pending_validation_timeout_seconds}s")
+        lines.append(f"   - Emergency close on imbalance: {self.config.emergency_close_on_imbalance}")
+        lines.append(f"   - Max position imbalance: {self.config.max_position_imbalance_pct:.1%}")
         if self.config.demo_mode:
-            self.logger().info("   - Demo mode: ENABLED (no real orders will be placed)")
-            self.logger().info(f"   - Demo balance (quote): ${self.config.demo_account_balance_quote}")
-            self.logger().info(f"   - Demo fill delay: {self.config.demo_fill_delay_seconds}s")
-            self.logger().info(f"   - Demo close delay: {self.config.demo_close_delay_seconds}s")
+            lines.append("   - Demo mode: ENABLED (no real orders will be placed)")
+            lines.append(f"   - Demo balance (quote): ${self.config.demo_account_balance_quote}")
+            lines.append(f"   - Demo fill delay: {self.config.demo_fill_delay_seconds}s")
+            lines.append(f"   - Demo close delay: {self.config.demo_close_delay_seconds}s")
             if self.demo_metrics_enabled:
-                self.logger().info(f"   - Demo run id: {self.demo_run_id}")
-                self.logger().info(f"   - Demo metrics file: {self.demo_metrics_file}")
-                self.logger().info(f"   - Demo metrics interval: {self.demo_metrics_interval_seconds}s")
-        self.logger().info("=" * 80)
+                lines.append(f"   - Demo run id: {self.demo_run_id}")
+                lines.append(f"   - Demo metrics file: {self.demo_metrics_file}")
+                lines.append(f"   - Demo metrics interval: {self.demo_metrics_interval_seconds}s")
+        lines.append("=" * 80)
+        self.logger().info("\n".join(lines))
 
         self.apply_initial_setting()
         self.check_quote_currency_consistency()
 
-        self.logger().info(" Strategy initialization complete")
-        self.logger().info("=" * 80)
+        self.logger().info(" Strategy initialization complete\n" + "=" * 80)
 
     def check_quote_currency_consistency(self):
         """
         WARNING: Check if exchanges use different quote currencies (USDT vs USD).
         This is important because USDT can depeg from USD, causing false arbitrage signals.
         """
-        quote_currencies = set()
-        for connector_name in self.config.connectors:
-            quote = self.quote_markets_map.get(connector_name, "USDT")
-            quote_currencies.add(quote)
+        quote_currencies = set(self._quote_by_connector.values())
 
         if len(quote_currencies) > 1:
             self.logger().warning("  CRITICAL WARNING: Multiple quote currencies detected!")
@@ -443,10 +573,11 @@ class FundingRateArbitrage(StrategyV2Base):
                             )
                     else:
                         trading_pairs = sorted(desired_pairs)
+                    leveraged_pairs = []
                     for trading_pair in trading_pairs:
                         try:
                             connector.set_leverage(trading_pair, self.config.leverage)
-                            self.logger().debug(f" Set {connector_name} {trading_pair} leverage to {self.config.leverage}x")
+                            leveraged_pairs.append(trading_pair)
                         except Exception as e:
                             self.logger().error(f" Failed to set leverage for {connector_name} {trading_pair}: {e}")
                             self.alerter.warning(
@@ -461,6 +592,11 @@ class FundingRateArbitrage(StrategyV2Base):
                                 }
                             )
                             # Continue with next trading pair
+                    if leveraged_pairs:
+                        self.logger().info(
+                            f" Set {connector_name} leverage to {self.config.leverage}x on {len(leveraged_pairs)} pairs: "
+                            f"{', '.join(leveraged_pairs)}"
+                        )
 
                 except Exception as e:
                     self.logger().error(f" Unexpected error applying initial settings for {connector_name}: {e}")
@@ -478,37 +614,64 @@ class FundingRateArbitrage(StrategyV2Base):
 
     def get_connector_position_counts(self) -> Dict[str, int]:
         counts = {connector: 0 for connector in self.config.connectors}
-        for info in self.active_funding_arbitrages.values():
-            counts[info["connector_1"]] = counts.get(info["connector_1"], 0) + 1
-            counts[info["connector_2"]] = counts.get(info["connector_2"], 0) + 1
-        for info in self.pending_funding_arbitrages.values():
-            counts[info["connector_1"]] = counts.get(info["connector_1"], 0) + 1
-            counts[info["connector_2"]] = counts.get(info["connector_2"], 0) + 1
-        for info in self.closing_funding_arbitrages.values():
-            counts[info["connector_1"]] = counts.get(info["connector_1"], 0) + 1
-            counts[info["connector_2"]] = counts.get(info["connector_2"], 0) + 1
+        counts.update(self._connector_refcount)
         return counts
 
+    def _track_position_connectors(self, info: dict, delta: int):
+        """Add (delta=1) or release (delta=-1) the connectors of a position in the per-connector counts."""
+        cap = self.config.max_positions_per_connector
+        for connector in (info["connector_1"], info["connector_2"]):
+            count = self._connector_refcount[connector] + delta
+            if count > 0:
+                self._connector_refcount[connector] = count
+            else:
+                self._connector_refcount.pop(connector, None)
+            if cap > 0 and count >= cap:
+                self._connectors_in_use.add(connector)
+            else:
+                self._connectors_in_use.discard(connector)
+
     def get_connectors_in_use(self) -> Set[str]:
         # Only block connectors if a per-connector cap is set
         if self.config.max_positions_per_connector <= 0:
             return set()
-        counts = self.get_connector_position_counts()
-        return {
-            connector for connector, count in counts.items()
-            if count >= self.config.max_positions_per_connector
-        }
+        return self._connectors_in_use
 
     def get_available_connectors(self) -> Set[str]:
         if self.config.max_positions_per_connector <= 0:
-            return set(self.config.connectors)
-        return set(self.config.connectors) - self.get_connectors_in_use()
+            return set(self._connectors_set)
+        return self._connectors_set - self._connectors_in_use
+
+    def _warn_once(self, key: tuple, msg: str, *args, cooldown: float = 60):
+        """
+        Log a warning at most once per cooldown for the given (connector, ..., reason) key, so a connector that
+        is persistently unavailable does not flood the logs on every tick.
+        msg is a %-style format string; args are only formatted when the warning is actually emitted.
+        """
+        now = self.current_timestamp
+        last = self._warn_debounce.get(key)
+        if last is not None and now - last <= cooldown:
+            return
+        self._warn_debounce[key] = now
+        self.logger().warning(msg, *args)
+
+    def _consume_available_connectors(self, available_connectors: Set[str], connector_1: str, connector_2: str) -> bool:
+        """
+        Drop the legs of a just admitted position from available_connectors if they reached their cap.
+        Returns True if the set changed.
+        """
+        changed = False
+        for connector in (connector_1, connector_2):
+            if connector in self._connectors_in_use and connector in available_connectors:
+                available_connectors.discard(connector)
+                changed = True
+        return changed
 
     def _apply_rate_limit(self, connector_name: str, action: str) -> bool:
         wait_time = self.rate_limiter.wait_if_needed(connector_name, block=self.config.rate_limit_blocking)
         if not self.config.rate_limit_blocking and wait_time > 0:
             self.logger().debug(
-                f"Rate limit hit for {connector_name}; skipping {action} (wait {wait_time:.3f}s)"
+                "Rate limit hit for %s; skipping %s (wait %.3fs)", connector_name, action, wait_time
             )
             return False
         return True
@@ -519,11 +682,24 @@ class FundingRateArbitrage(StrategyV2Base):
     # With rate limiting to prevent IP bans
     # ========================================
 
+    def _refresh_tick_market_cache(self):
+        if self._tick_price_cache_ts != self.current_timestamp:
+            self._tick_price_cache.clear()
+            self._tick_balance_cache.clear()
+            self._tick_price_cache_ts = self.current_timestamp
+
     def safe_get_price(self, connector_name: str, trading_pair: str, price_type=PriceType.MidPrice) -> Decimal | None:
         """
         Safe wrapper for get_price_by_type with error handling.
         Returns None if price unavailable instead of crashing.
+        Prices are memoized for the current tick, so the proposal and validation helpers share one lookup.
         """
+        self._refresh_tick_market_cache()
+        key = (connector_name, trading_pair, price_type)
+        cached_price = self._tick_price_cache.get(key)
+        if cached_price is not None:
+            return cached_price
+
         if not self._apply_rate_limit(connector_name, "price"):
             return None
 
@@ -534,18 +710,28 @@ class FundingRateArbitrage(StrategyV2Base):
                 price_type=price_type
             )
             if price is None:
-                self.logger().warning(f"Price is None for {connector_name} {trading_pair}")
+                self._warn_once(
+                    (connector_name, trading_pair, "price"), "Price is None for %s %s", connector_name, trading_pair
+                )
                 return None
-            return Decimal(str(price))
-        except (TypeError, ValueError, AttributeError) as e:
-            self.logger().error(f"Error getting price for {connector_name} {trading_pair}: {e}")
-            self.track_error()
-            return None
+            price = _to_decimal(price)
+            self._tick_price_cache[key] = price
+            return price
         except Exception as e:
-            self.logger().error(f"Unexpected error getting price for {connector_name} {trading_pair}: {e}")
+            self.logger().error(f"Error getting price for {connector_name} {trading_pair}: {e}")
             self.track_error()
             return None
 
+    def get_pair_mid_prices(self, token: str, connector_1: str, connector_2: str) -> Tuple[Decimal | None, Decimal | None]:
+        """
+        Mid prices of a token on both legs of an arbitrage.
+        Reads go through safe_get_price, so every later lookup of the same leg in this tick is a cache hit.
+        """
+        return (
+            self.safe_get_price(connector_1, self.get_trading_pair_for_connector(token, connector_1), PriceType.MidPrice),
+            self.safe_get_price(connector_2, self.get_trading_pair_for_connector(token, connector_2), PriceType.MidPrice),
+        )
+
     def safe_get_price_for_volume(self, connector_name: str, trading_pair: str, quote_volume: Decimal, is_buy: bool) -> Decimal | None:
         """Safe wrapper for get_price_for_quote_volume with error handling."""
         if not self._apply_rate_limit(connector_name, "price_for_volume"):
@@ -559,20 +745,28 @@ class FundingRateArbitrage(StrategyV2Base):
                 is_buy=is_buy
             )
             if result is None or result.result_price is None:
-                self.logger().warning(f"Price for volume is None for {connector_name} {trading_pair}")
+                self._warn_once(
+                    (connector_name, trading_pair, "price_for_volume"),
+                    "Price for volume is None for %s %s", connector_name, trading_pair
+                )
                 return None
-            return Decimal(str(result.result_price))
-        except (TypeError, ValueError, AttributeError) as e:
-            self.logger().error(f"Error getting price for volume {connector_name} {trading_pair}: {e}")
-            self.track_error()
-            return None
+            return _to_decimal(result.result_price)
         except Exception as e:
-            self.logger().error(f"Unexpected error getting price for volume {connector_name} {trading_pair}: {e}")
+            self.logger().error(f"Error getting price for volume {connector_name} {trading_pair}: {e}")
             self.track_error()
             return None
 
     def safe_get_balance(self, connector_name: str, currency: str) -> Decimal | None:
-        """Safe wrapper for get_available_balance with error handling."""
+        """
+        Safe wrapper for get_available_balance with error handling.
+        Balances are memoized for the current tick, so the balance check and position sizing share one lookup.
+        """
+        self._refresh_tick_market_cache()
+        key = (connector_name, currency)
+        cached_balance = self._tick_balance_cache.get(key)
+        if cached_balance is not None:
+            return cached_balance
+
         if not self._apply_rate_limit(connector_name, "balance"):
             return None
 
@@ -583,15 +777,15 @@ class FundingRateArbitrage(StrategyV2Base):
                 return None
             balance = connector.get_available_balance(currency)
             if balance is None:
-                self.logger().warning(f"Balance is None for {connector_name} {currency}")
-                return Decimal("0")
-            return Decimal(str(balance))
-        except (TypeError, ValueError, AttributeError, KeyError) as e:
-            self.logger().error(f"Error getting balance for {connector_name} {currency}: {e}")
-            self.track_error()
-            return None
+                self._warn_once(
+                    (connector_name, currency, "balance"), "Balance is None for %s %s", connector_name, currency
+                )
+                return _D_ZERO
+            balance = _to_decimal(balance)
+            self._tick_balance_cache[key] = balance
+            return balance
         except Exception as e:
-            self.logger().error(f"Unexpected error getting balance for {connector_name} {currency}: {e}")
+            self.logger().error(f"Error getting balance for {connector_name} {currency}: {e}")
             self.track_error()
             return None
 
@@ -618,31 +812,52 @@ class FundingRateArbitrage(StrategyV2Base):
                 position_action=position_action
             )
             if fee_obj is None or fee_obj.percent is None:
-                self.logger().warning(f"Fee is None for {connector_name}")
+                self._warn_once((connector_name, "fee"), "Fee is None for %s", connector_name)
                 # Return conservative estimate: 0.1% (typical taker fee)
-                return Decimal("0.001")
-            return Decimal(str(fee_obj.percent))
-        except (TypeError, ValueError, AttributeError, KeyError) as e:
-            self.logger().error(f"Error getting fee for {connector_name}: {e}")
-            self.track_error()
-            return Decimal("0.001")  # Fallback to conservative estimate
+                return _D_FEE_FALLBACK
+            fee = fee_obj.percent
+            return _to_decimal(fee)
         except Exception as e:
-            self.logger().error(f"Unexpected error getting fee for {connector_name}: {e}")
+            self.logger().error(f"Error getting fee for {connector_name}: {e}")
             self.track_error()
-            return Decimal("0.001")
+            return _D_FEE_FALLBACK  # Fallback to conservative estimate
+
+    def get_cached_fee(self, connector_name: str, base_currency: str, quote_currency: str,
+                       order_type: OrderType, order_side: TradeType, amount: Decimal,
+                       price: Decimal, is_maker: bool, position_action: PositionAction) -> Decimal | None:
+        """
+        Fee percent memoized per (connector, pair, is_maker, position_action, side) for _FEE_CACHE_TTL seconds.
+        The percent does not depend on amount or price. Failed lookups (None or the conservative fallback)
+        are not cached so they are retried on the next call.
+        """
+        key = (connector_name, base_currency, quote_currency, is_maker, position_action, order_side.name)
+        now = self.current_timestamp
+        cached = self._fee_cache.get(key)
+        if cached is not None and now - cached[0] < self._FEE_CACHE_TTL:
+            return cached[1]
+        fee = self.safe_get_fee(connector_name, base_currency, quote_currency, order_type, order_side,
+                                amount, price, is_maker, position_action)
+        if fee is not None and fee is not _D_FEE_FALLBACK:
+            self._fee_cache[key] = (now, fee)
+        return fee
 
     def safe_split_trading_pair(self, trading_pair: str) -> tuple[str, str] | None:
         """
         Safely split trading pair into base and quote currencies.
-        Handles multiple formats: BTC-USDT, BTC/USDT, BTCUSDT.
+        Handles separated formats: BTC-USDT, BTC/USDT, BTC_USDT. Separators are tried in that order and the
+        first one that occurs exactly once is used, so BTC-USDT_PERP splits into BTC and USDT_PERP.
+        Pairs without a separator (BTCUSDT) are rejected.
+        Pairs built by init_markets are served from the _pair_parts cache.
         """
+        parts = self._pair_parts.get(trading_pair)
+        if parts is not None:
+            return parts
         try:
-            # Try different separators
-            for sep in ["-", "/", "_"]:
-                if sep in trading_pair:
-                    parts = trading_pair.split(sep)
-                    if len(parts) == 2:
-                        return parts[0], parts[1]
+            for sep in _PAIR_SEPARATORS:
+                if trading_pair.count(sep) == 1:
+                    base, _, quote = trading_pair.partition(sep)
+                    self._pair_parts[trading_pair] = (base, quote)
+                    return base, quote
 
             # If no separator found, log warning
             self.logger().error(f"Cannot split trading_pair: {trading_pair} (no separator found)")
@@ -656,14 +871,11 @@ class FundingRateArbitrage(StrategyV2Base):
         Track errors and send alert if error rate is too high.
         Resets error count every hour.
         """
-        import time
-
-        current_time = time.time()
+        # Monotonic clock so wall-clock adjustments cannot stretch or skip the window
+        current_time = time.monotonic()
 
         # Reset error count every hour
-        if self.last_error_reset is None:
-            self.last_error_reset = current_time
-        elif current_time - self.last_error_reset > 3600:  # 1 hour
+        if current_time - self.last_error_reset > 3600:  # 1 hour
             if self.error_count > 0:
                 self.logger().info(f"Resetting error count: {self.error_count} errors in last hour")
             self.error_count = 0
@@ -671,6 +883,8 @@ class FundingRateArbitrage(StrategyV2Base):
 
         # Increment error count
         self.error_count += 1
+        # Connector errors usually come with a reconnect; re-query fees afterwards
+        self._fee_cache.clear()
 
         # Alert if error rate exceeds threshold (20 errors per hour)
         if self.error_count >= 20:
@@ -688,8 +902,8 @@ class FundingRateArbitrage(StrategyV2Base):
         if self.config.leverage <= 0:
             return False, f"Invalid leverage: {self.config.leverage}"
 
-        quote_1 = self.quote_markets_map.get(connector_1, "USDT")
-        quote_2 = self.quote_markets_map.get(connector_2, "USDT")
+        quote_1 = self._quote_by_connector[connector_1]
+        quote_2 = self._quote_by_connector[connector_2]
 
         # BUG FIX #3: Use safe_get_balance instead of direct call
         balance_1 = self.safe_get_balance(connector_1, quote_1)
@@ -704,7 +918,7 @@ class FundingRateArbitrage(StrategyV2Base):
         required_margin = position_size_quote / self.config.leverage
 
         # Add 10% buffer for fees and safety
-        required_margin_with_buffer = required_margin * Decimal("1.10")
+        required_margin_with_buffer = required_margin * _D_BUFFER
 
         if balance_1 < required_margin_with_buffer:
             return False, f"{connector_1} insufficient balance: {balance_1} < {required_margin_with_buffer} required"
@@ -737,16 +951,30 @@ class FundingRateArbitrage(StrategyV2Base):
         if expected_price_1 <= 0 or expected_price_2 <= 0:
             return False, f"Invalid expected prices: {expected_price_1}, {expected_price_2}"
 
-        # Calculate slippage
-        slippage_1 = abs(current_price_1 - expected_price_1) / expected_price_1
-        slippage_2 = abs(current_price_2 - expected_price_2) / expected_price_2
+        # Fast path: prices read within the same tick come from the price cache and are unchanged
+        if current_price_1 == expected_price_1 and current_price_2 == expected_price_2:
+            return True, ""
+
+        # Calculate slippage; a threshold check only, so float is precise enough
+        expected_1 = float(expected_price_1)
+        expected_2 = float(expected_price_2)
+        deviation_1 = abs(float(current_price_1) - expected_1)
+        deviation_2 = abs(float(current_price_2) - expected_2)
+        max_slippage_pct = self._max_slippage_pct_f
 
+        # Compare deviations against the warning level scaled by price; divide only when a message is needed
+        warn_pct = max_slippage_pct * 0.5
+        if deviation_1 <= expected_1 * warn_pct and deviation_2 <= expected_2 * warn_pct:
+            return True, ""
+
+        slippage_1 = deviation_1 / expected_1
+        slippage_2 = deviation_2 / expected_2
         max_slippage = max(slippage_1, slippage_2)
 
-        if max_slippage > self.config.max_slippage_pct:
+        if max_slippage > max_slippage_pct:
             return False, f"Slippage too high: {max_slippage:.4%} > {self.config.max_slippage_pct:.4%} (C1: {slippage_1:.4%}, C2: {slippage_2:.4%})"
 
-        if max_slippage > self.config.max_slippage_pct * Decimal("0.5"):
+        if max_slippage > warn_pct:
             return True, f"Warning: Slippage {max_slippage:.4%} (C1: {slippage_1:.4%}, C2: {slippage_2:.4%})"
 
         return True, ""
@@ -832,21 +1060,21 @@ class FundingRateArbitrage(StrategyV2Base):
             if price is None or price <= 0:
                 return False, "Price not available for depth check"
 
-            # Calculate required base amount
-            required_base_amount = quote_volume / price
+            # Calculate required base amount; a threshold check only, so float is precise enough
+            required_base_amount = float(quote_volume) / float(price)
 
             # Check appropriate side of order book
             if is_buy:
                 # For buying, we need asks (sell orders)
-                total_volume = sum(Decimal(str(level.amount)) for level in islice(order_book.ask_entries(), 20))
+                total_volume = sum(float(level.amount) for level in islice(order_book.ask_entries(), 20))
                 side_name = "asks"
             else:
                 # For selling, we need bids (buy orders)
-                total_volume = sum(Decimal(str(level.amount)) for level in islice(order_book.bid_entries(), 20))
+                total_volume = sum(float(level.amount) for level in islice(order_book.bid_entries(), 20))
                 side_name = "bids"
 
             # Require minimum depth (e.g., 3x the required amount)
-            min_required = required_base_amount * self.config.min_order_book_depth_multiplier
+            min_required = required_base_amount * self._depth_multiplier_f
 
             if total_volume < min_required:
                 return False, f"Insufficient {side_name} depth: {total_volume:.4f} < {min_required:.4f}"
@@ -862,6 +1090,13 @@ class FundingRateArbitrage(StrategyV2Base):
             self.track_error()
             return False, f"Order book check failed: {e}"
 
+    @staticmethod
+    def _imbalance_ratio(notional_1: Decimal, notional_2: Decimal) -> float:
+        """Relative notional imbalance of the two legs, as float for threshold checks."""
+        notional_1 = float(notional_1)
+        notional_2 = float(notional_2)
+        return abs(notional_1 - notional_2) / max(notional_1, notional_2)
+
     def validate_position_hedge(self, token: str) -> tuple[bool, str]:
         """
         Validate that positions are properly hedged (equal notional values).
@@ -879,36 +1114,18 @@ class FundingRateArbitrage(StrategyV2Base):
             filled_quote_2 = arbitrage_info.get("demo_filled_quote_2")
             if filled_quote_1 is None or filled_quote_2 is None:
                 return False, f"Demo filled quotes unavailable: {filled_quote_1}, {filled_quote_2}"
-            filled_quote_1 = Decimal(str(filled_quote_1))
-            filled_quote_2 = Decimal(str(filled_quote_2))
+            filled_quote_1 = _to_decimal(filled_quote_1)
+            filled_quote_2 = _to_decimal(filled_quote_2)
             if filled_quote_1 <= 0:
                 return False, f"{connector_1} demo position not filled: {filled_quote_1}"
             if filled_quote_2 <= 0:
                 return False, f"{connector_2} demo position not filled: {filled_quote_2}"
 
-            notional_1 = abs(filled_quote_1)
-            notional_2 = abs(filled_quote_2)
-            if notional_1 == 0 or notional_2 == 0:
-                return False, f"Zero notional value detected: {notional_1}, {notional_2}"
-
-            imbalance = abs(notional_1 - notional_2) / max(notional_1, notional_2)
-
-            if imbalance > self.config.max_position_imbalance_pct:
-                return False, (
-                    f"Position imbalance {imbalance:.2%} > {self.config.max_position_imbalance_pct:.2%} "
-                    f"(Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
-                )
-
-            if imbalance > self.config.max_position_imbalance_pct * Decimal("0.5"):
-                return True, f"Warning: Position imbalance {imbalance:.2%} (Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
-
-            return True, f"Hedge OK: imbalance {imbalance:.2%}"
+            # Both fills were checked to be > 0 above, so they are the notionals as is
+            return self._check_hedge_imbalance(token, filled_quote_1, filled_quote_2)
 
         # Get executors
-        executors = self.filter_executors(
-            executors=self.get_all_executors(),
-            filter_func=lambda x: x.id in arbitrage_info["executors_ids"]
-        )
+        executors = self._get_active_executors_by_ids(arbitrage_info["executors_ids"])
 
         if len(executors) != 2:
             return False, f"Expected 2 executors, found {len(executors)}"
@@ -935,23 +1152,30 @@ class FundingRateArbitrage(StrategyV2Base):
         if filled_quote_2 is None or filled_quote_2 <= 0:
             return False, f"{connector_2} position not filled: {filled_quote_2}"
 
-        # Use quote notional directly to avoid price dependency
-        notional_1 = abs(filled_quote_1)
-        notional_2 = abs(filled_quote_2)
-
-        # Check imbalance
-        if notional_1 == 0 or notional_2 == 0:
-            return False, f"Zero notional value detected: {notional_1}, {notional_2}"
-
-        imbalance = abs(notional_1 - notional_2) / max(notional_1, notional_2)
-
-        if imbalance > self.config.max_position_imbalance_pct:
-            return False, f"Position imbalance {imbalance:.2%} > {self.config.max_position_imbalance_pct:.2%} (Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
-
-        if imbalance > self.config.max_position_imbalance_pct * Decimal("0.5"):
-            return True, f"Warning: Position imbalance {imbalance:.2%} (Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
+        # Use quote notional directly to avoid price dependency; both fills were checked to be > 0 above
+        return self._check_hedge_imbalance(token, filled_quote_1, filled_quote_2)
 
-        return True, f"Hedge OK: imbalance {imbalance:.2%}"
+    def _check_hedge_imbalance(self, token: str, notional_1: Decimal, notional_2: Decimal) -> tuple[bool, str]:
+        """
+        Hedge verdict of an active position from its two leg notionals.
+        The verdict only depends on the fills, so it is reused until either leg's filled notional changes.
+        """
+        fills = (notional_1, notional_2)
+        cached = self._hedge_cache.get(token)
+        if cached is not None and cached[0] == fills:
+            return cached[1]
+
+        imbalance = self._imbalance_ratio(notional_1, notional_2)
+        max_imbalance_pct = self._max_imbalance_pct_f
+
+        if imbalance > max_imbalance_pct:
+            result = False, f"Position imbalance {imbalance:.2%} > {self.config.max_position_imbalance_pct:.2%} (Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
+        elif imbalance > max_imbalance_pct * 0.5:
+            result = True, f"Warning: Position imbalance {imbalance:.2%} (Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
+        else:
+            result = True, f"Hedge OK: imbalance {imbalance:.2%}"
+        self._hedge_cache[token] = (fills, result)
+        return result
 
     def get_initial_balance(self, connector_name: str, currency: str) -> Decimal | None:
         key = (connector_name, currency)
@@ -973,16 +1197,16 @@ class FundingRateArbitrage(StrategyV2Base):
         # BUG FIX #12: Check leverage before calculation
         if self.config.leverage <= 0:
             self.logger().error(f"Invalid leverage: {self.config.leverage}")
-            return Decimal("0")
+            return _D_ZERO
 
-        quote_1 = self.quote_markets_map.get(connector_1, "USDT")
-        quote_2 = self.quote_markets_map.get(connector_2, "USDT")
+        quote_1 = self._quote_by_connector[connector_1]
+        quote_2 = self._quote_by_connector[connector_2]
 
         if self.config.demo_mode:
             demo_balance = self.config.demo_account_balance_quote
             if demo_balance is None or demo_balance <= 0:
                 self.logger().error(f"Invalid demo balance: {demo_balance}")
-                return Decimal("0")
+                return _D_ZERO
             position_size_pct = self.config.position_size_quote_pct
             if position_size_pct is not None and position_size_pct > 0:
                 if self.config.max_positions_per_connector > 0:
@@ -991,7 +1215,7 @@ class FundingRateArbitrage(StrategyV2Base):
                 if self.config.position_size_quote and self.config.position_size_quote > 0:
                     return min(self.config.position_size_quote, max_position)
                 return max_position
-            max_position = demo_balance * self.config.leverage * Decimal("0.95")
+            max_position = demo_balance * self.config.leverage * _D_095
             return min(self.config.position_size_quote, max_position)
 
         # Calculate maximum position size based on available balance and leverage
@@ -1007,7 +1231,7 @@ class FundingRateArbitrage(StrategyV2Base):
                 self.logger().warning(
                     f"Initial balance unavailable for {connector_1} or {connector_2}"
                 )
-                return Decimal("0")
+                return _D_ZERO
             max_position_1 = initial_balance_1 * self.config.leverage * position_size_pct
             max_position_2 = initial_balance_2 * self.config.leverage * position_size_pct
             max_position = min(max_position_1, max_position_2)
@@ -1021,11 +1245,11 @@ class FundingRateArbitrage(StrategyV2Base):
 
         if balance_1 is None or balance_2 is None:
             self.logger().warning(f"Balance unavailable for {connector_1} or {connector_2}")
-            return Decimal("0")
+            return _D_ZERO
 
         # Fallback: Use fixed position size, capped by available balance * leverage
-        max_position_1 = balance_1 * self.config.leverage * Decimal("0.95")  # 95% to leave buffer for fees
-        max_position_2 = balance_2 * self.config.leverage * Decimal("0.95")
+        max_position_1 = balance_1 * self.config.leverage * _D_095  # 95% to leave buffer for fees
+        max_position_2 = balance_2 * self.config.leverage * _D_095
         return min(self.config.position_size_quote, max_position_1, max_position_2)
 
     def get_funding_info_by_token(self, token, connectors: Set[str] | None = None):
@@ -1033,20 +1257,62 @@ class FundingRateArbitrage(StrategyV2Base):
         This method provides the funding rates across all the connectors
         """
         funding_rates = {}
-        connectors_to_use = connectors or set(self.connectors.keys())
-        for connector_name in connectors_to_use:
+        for connector_name in self._connectors_tuple:
+            if connectors and connector_name not in connectors:
+                continue
+            trading_pair = self.get_trading_pair_for_connector(token, connector_name)
+            supported_pairs = self._supports_funding_info.get(connector_name)
+            if supported_pairs is None or trading_pair not in supported_pairs:
+                continue
             try:
                 connector = self.connectors[connector_name]
-                trading_pair = self.get_trading_pair_for_connector(token, connector_name)
                 funding_info = connector.get_funding_info(trading_pair)
                 # Only add if funding_info is not None
                 if funding_info is not None:
                     funding_rates[connector_name] = funding_info
             except Exception as e:
-                self.logger().warning(f"Error getting funding info for {token} on {connector_name}: {e}")
+                self._warn_once(
+                    (connector_name, token, "funding_info"),
+                    "Error getting funding info for %s on %s: %s", token, connector_name, e
+                )
                 continue
         return funding_rates
 
+    def get_funding_info_by_tokens(self, tokens, connectors: Set[str] | None = None) -> Dict[str, Dict]:
+        """
+        Collect the funding info reports of several tokens in a single round over the connectors.
+        Funding info is served from the connectors' in-memory state, so one pass is all that is needed.
+        """
+        return {token: self.get_funding_info_by_token(token, connectors) for token in tokens}
+
+    def _refresh_tick_cache(self):
+        if self._tick_funding_ts != self.current_timestamp:
+            self._tick_funding_snapshot.clear()
+            self._tick_normalized_rates.clear()
+            self._tick_funding_ts = self.current_timestamp
+
+    def get_tick_funding_reports(self, tokens) -> Dict[str, Dict]:
+        """
+        Funding info reports of the given tokens on all connectors for the current tick.
+        Each token is collected at most once per tick and shared by the proposal, exit and status code.
+        """
+        self._refresh_tick_cache()
+        missing = [token for token in tokens if token not in self._tick_funding_snapshot]
+        if missing:
+            self._tick_funding_snapshot.update(self.get_funding_info_by_tokens(missing))
+        return self._tick_funding_snapshot
+
+    def get_tick_normalized_funding_rate(self, token: str, connector_name: str) -> Decimal | None:
+        """Normalized funding rate of a token on a connector, memoized for the current tick."""
+        self._refresh_tick_cache()
+        key = (token, connector_name)
+        if key not in self._tick_normalized_rates:
+            funding_info_report = self.get_tick_funding_reports((token,))[token]
+            self._tick_normalized_rates[key] = self.get_normalized_funding_rate_in_seconds(
+                funding_info_report, connector_name
+            )
+        return self._tick_normalized_rates[key]
+
     def get_current_profitability_after_fees(
             self, token: str, connector_1: str, connector_2: str, side: TradeType, quote_volume: Decimal):
         """
@@ -1068,7 +1334,7 @@ class FundingRateArbitrage(StrategyV2Base):
 
         if connector_1_price is None or connector_2_price is None:
             self.logger().error(f"Price unavailable for profitability calculation: {connector_1} or {connector_2}")
-            return Decimal("-999")  # Return very negative value to skip this opportunity
+            return _D_UNPROFITABLE  # Return very negative value to skip this opportunity
 
         # BUG FIX #6: Use safe_split_trading_pair instead of direct split
         pair_1_parts = self.safe_split_trading_pair(trading_pair_1)
@@ -1076,7 +1342,7 @@ class FundingRateArbitrage(StrategyV2Base):
 
         if pair_1_parts is None or pair_2_parts is None:
             self.logger().error(f"Cannot split trading pairs: {trading_pair_1} or {trading_pair_2}")
-            return Decimal("-999")
+            return _D_UNPROFITABLE
 
         base_1, quote_1 = pair_1_parts
         base_2, quote_2 = pair_2_parts
@@ -1084,37 +1350,42 @@ class FundingRateArbitrage(StrategyV2Base):
         # Protect against zero prices
         if connector_1_price <= 0 or connector_2_price <= 0:
             self.logger().error(f"Invalid prices: {connector_1_price}, {connector_2_price}")
-            return Decimal("-999")
+            return _D_UNPROFITABLE
+
+        # Order amounts and the opposite side are shared by the open and close fee lookups
+        amount_1 = quote_volume / connector_1_price
+        amount_2 = quote_volume / connector_2_price
+        opposite_side = TradeType.SELL if side == TradeType.BUY else TradeType.BUY
 
         # Calculate fees for OPENING positions
-        # BUG FIX #4: Use safe_get_fee instead of direct call
-        estimated_fees_open_connector_1 = self.safe_get_fee(
+        # BUG FIX #4: Use safe_get_fee (cached per connector/side) instead of direct call
+        estimated_fees_open_connector_1 = self.get_cached_fee(
             connector_1, base_1, quote_1,
-            OrderType.MARKET, side, quote_volume / connector_1_price,
+            OrderType.MARKET, side, amount_1,
             connector_1_price, False, PositionAction.OPEN
         )
-        estimated_fees_open_connector_2 = self.safe_get_fee(
+        estimated_fees_open_connector_2 = self.get_cached_fee(
             connector_2, base_2, quote_2,
-            OrderType.MARKET, TradeType.BUY if side != TradeType.BUY else TradeType.SELL,
-            quote_volume / connector_2_price, connector_2_price, False, PositionAction.OPEN
+            OrderType.MARKET, opposite_side,
+            amount_2, connector_2_price, False, PositionAction.OPEN
         )
 
         # Calculate fees for CLOSING positions (opposite sides)
-        estimated_fees_close_connector_1 = self.safe_get_fee(
+        estimated_fees_close_connector_1 = self.get_cached_fee(
             connector_1, base_1, quote_1,
-            OrderType.MARKET, TradeType.BUY if side != TradeType.BUY else TradeType.SELL,
-            quote_volume / connector_1_price, connector_1_price, False, PositionAction.CLOSE
+            OrderType.MARKET, opposite_side,
+            amount_1, connector_1_price, False, PositionAction.CLOSE
         )
-        estimated_fees_close_connector_2 = self.safe_get_fee(
+        estimated_fees_close_connector_2 = self.get_cached_fee(
             connector_2, base_2, quote_2,
             OrderType.MARKET, side,  # BUG FIX #15: Closes the opposite position opened on connector_2
-            quote_volume / connector_2_price, connector_2_price, False, PositionAction.CLOSE
+            amount_2, connector_2_price, False, PositionAction.CLOSE
         )
 
-        if None in [estimated_fees_open_connector_1, estimated_fees_open_connector_2,
-                   estimated_fees_close_connector_1, estimated_fees_close_connector_2]:
+        if (estimated_fees_open_connector_1 is None or estimated_fees_open_connector_2 is None
+                or estimated_fees_close_connector_1 is None or estimated_fees_close_connector_2 is None):
             self.logger().error(f"Fee calculation failed for {connector_1} or {connector_2}")
-            return Decimal("-999")
+            return _D_UNPROFITABLE
 
         # Total fees = open + close for both connectors
         total_fees = (estimated_fees_open_connector_1 + estimated_fees_close_connector_1 +
@@ -1127,32 +1398,52 @@ class FundingRateArbitrage(StrategyV2Base):
         return estimated_trade_pnl_pct - total_fees
 
     def get_most_profitable_combination(self, funding_info_report: Dict):
-        best_combination = None
-        highest_profitability = 0
-        for connector_1 in funding_info_report:
-            for connector_2 in funding_info_report:
-                if connector_1 != connector_2:
-                    quote_1 = self.quote_markets_map.get(connector_1, "USDT")
-                    quote_2 = self.quote_markets_map.get(connector_2, "USDT")
-                    if quote_1 != quote_2:
-                        self.logger().warning(
-                            f"Skipping pair {connector_1}/{connector_2} due to mismatched quotes ({quote_1} vs {quote_2})"
-                        )
-                        continue
-                    rate_connector_1 = self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_1)
-                    rate_connector_2 = self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_2)
-                    if rate_connector_1 is None or rate_connector_2 is None:
-                        continue
-                    funding_rate_diff = abs(rate_connector_1 - rate_connector_2) * self.funding_profitability_interval
-                    if funding_rate_diff > highest_profitability:
-                        trade_side = TradeType.BUY if rate_connector_1 < rate_connector_2 else TradeType.SELL
-                        highest_profitability = funding_rate_diff
-                        best_combination = (connector_1, connector_2, trade_side, funding_rate_diff)
-        return best_combination
+        """
+        Find the connector pair with the widest funding rate spread.
+        Each rate is normalized once and the extremes are tracked per quote currency (pairs with mismatched
+        quotes are not tradable), so the best pair of each group is simply its (lowest, highest) rate. The
+        returned side is always BUY: long on the lower-rate connector, short on the higher-rate one.
+        The scan compares float rates; only the selected pair is recomputed in Decimal.
+        Mixed quote currencies are static config and are reported once by check_quote_currency_consistency.
+        """
+        # quote -> [min_connector, min_rate, max_connector, max_rate]
+        extremes = {}
+        quote_by_connector = self._quote_by_connector
+        for connector_name in funding_info_report:
+            rate_and_interval = self._get_funding_rate_and_interval(funding_info_report, connector_name)
+            if rate_and_interval is None:
+                continue
+            rate = float(rate_and_interval[0]) / rate_and_interval[1]
+            quote = quote_by_connector[connector_name]
+            group = extremes.get(quote)
+            if group is None:
+                extremes[quote] = [connector_name, rate, connector_name, rate]
+                continue
+            if rate < group[1]:
+                group[0], group[1] = connector_name, rate
+            if rate > group[3]:
+                group[2], group[3] = connector_name, rate
+
+        best_pair = None
+        highest_spread = 0.0
+        for connector_min, rate_min, connector_max, rate_max in extremes.values():
+            if rate_max - rate_min > highest_spread:
+                highest_spread = rate_max - rate_min
+                best_pair = (connector_min, connector_max)
+        if best_pair is None:
+            return None
 
-    def get_normalized_funding_rate_in_seconds(self, funding_info_report, connector_name) -> Decimal | None:
+        connector_min, connector_max = best_pair
+        funding_rate_diff = (
+            self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_max) -
+            self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_min)
+        ) * self.funding_profitability_interval
+        return connector_min, connector_max, TradeType.BUY, funding_rate_diff
+
+    def _get_funding_rate_and_interval(self, funding_info_report, connector_name) -> Tuple | None:
         """
         BUG FIX #13: Safe access to funding_info_report with validation.
+        Returns the raw funding rate and the payment interval in seconds.
         """
         # Check if connector exists in report
         if connector_name not in funding_info_report:
@@ -1161,15 +1452,26 @@ class FundingRateArbitrage(StrategyV2Base):
 
         funding_info = funding_info_report[connector_name]
         if funding_info is None or funding_info.rate is None:
-            self.logger().warning(f"Funding info or rate is None for {connector_name}")
+            self._warn_once((connector_name, "funding_rate"), "Funding info or rate is None for %s", connector_name)
             return None
 
-        interval = self.funding_payment_interval_map.get(connector_name, 60 * 60 * 8)
+        interval = self._funding_interval_by_connector.get(connector_name, 60 * 60 * 8)
         if interval <= 0:
             self.logger().error(f"Invalid funding payment interval for {connector_name}: {interval}")
             return None
+        return funding_info.rate, interval
 
-        return Decimal(str(funding_info.rate)) / Decimal(str(interval))
+    def get_normalized_funding_rate_in_seconds(self, funding_info_report, connector_name) -> Decimal | None:
+        """Funding rate per second for a connector, or None if it is unavailable."""
+        rate_and_interval = self._get_funding_rate_and_interval(funding_info_report, connector_name)
+        if rate_and_interval is None:
+            return None
+        rate, interval = rate_and_interval
+
+        interval_decimal = self._interval_decimal_map.get(connector_name)
+        if interval_decimal is None:
+            interval_decimal = Decimal(interval)
+        return _to_decimal(rate) / interval_decimal
 
     def create_actions_proposal(self) -> List[CreateExecutorAction]:
         """
@@ -1180,6 +1482,9 @@ class FundingRateArbitrage(StrategyV2Base):
         at market to open the possibilities for other people to create variations like sending limit position executors
         and if one gets filled buy market the other one to improve the entry prices.
         """
+        if self.current_timestamp < self._next_scan_ts:
+            return []
+
         if self.config.demo_mode:
             return self._create_demo_positions()
 
@@ -1188,53 +1493,56 @@ class FundingRateArbitrage(StrategyV2Base):
         if len(available_connectors) < 2:
             return create_actions
 
-        for token in self.config.tokens:
-            if (token in self.active_funding_arbitrages
-                    or token in self.pending_funding_arbitrages
-                    or token in self.closing_funding_arbitrages):
-                continue
-            funding_info_report = self.get_funding_info_by_token(token, available_connectors)
+        tokens_to_scan = [
+            token for token in self._tokens_tuple
+            if token not in self.active_funding_arbitrages
+            and token not in self.pending_funding_arbitrages
+            and token not in self.closing_funding_arbitrages
+        ]
+        funding_info_reports = self.get_tick_funding_reports(tokens_to_scan)
+        filter_connectors = len(available_connectors) < len(self._connectors_tuple)
+        min_profitability = self.config.min_funding_rate_profitability
+        require_trade_profit = self.config.trade_profitability_condition_to_enter
+        candidates = []
+
+        for token in tokens_to_scan:
+            funding_info_report = funding_info_reports[token]
+            if filter_connectors:
+                # Drop connectors that reached their per-connector cap
+                funding_info_report = {
+                    connector_name: funding_info for connector_name, funding_info in funding_info_report.items()
+                    if connector_name in available_connectors
+                }
             if not funding_info_report or len(funding_info_report) < 2:
                 continue
             best_combination = self.get_most_profitable_combination(funding_info_report)
             if best_combination is None:
                 continue
             connector_1, connector_2, trade_side, expected_profitability = best_combination
-            if expected_profitability >= self.config.min_funding_rate_profitability:
+            if expected_profitability >= min_profitability:
+                candidates.append(token)
+                # SAFETY CHECK 1: Check time to next funding settlement (BUG FIX #17)
+                # Don't open position if too close to funding time (would miss payment).
+                # Runs first: it only reads the funding snapshot, while the checks below query the connectors.
+                funding_time_ok, funding_time_msg = self.check_time_to_funding(funding_info_report, connector_1, connector_2)
+                if not funding_time_ok:
+                    self.logger().warning(f"Skipping {token}: {funding_time_msg}")
+                    continue
+
                 position_size_quote = self.get_position_size_quote(connector_1, connector_2)
                 if position_size_quote <= 0:
                     self.logger().warning(f"Skipping {token}: position_size_quote is zero or negative")
                     continue
 
-                # SAFETY CHECK 1: Validate sufficient balance
+                # SAFETY CHECK 1.5: Validate sufficient balance
                 balance_valid, balance_msg = self.validate_sufficient_balance(connector_1, connector_2, position_size_quote)
                 if not balance_valid:
                     self.logger().warning(f"Skipping {token}: {balance_msg}")
                     continue
 
-                # SAFETY CHECK 1.5: Check time to next funding settlement (BUG FIX #17)
-                # Don't open position if too close to funding time (would miss payment)
-                funding_time_ok, funding_time_msg = self.check_time_to_funding(funding_info_report, connector_1, connector_2)
-                if not funding_time_ok:
-                    self.logger().warning(f"Skipping {token}: {funding_time_msg}")
-                    continue
-
-                current_profitability = self.get_current_profitability_after_fees(
-                    token, connector_1, connector_2, trade_side, position_size_quote
-                )
-                if current_profitability == Decimal("-999"):
-                    self.logger().warning(
-                        f"Skipping {token}: profitability calculation failed for {connector_1}/{connector_2}"
-                    )
-                    continue
-
                 # SAFETY CHECK 2: Slippage protection
-                trading_pair_1 = self.get_trading_pair_for_connector(token, connector_1)
-                trading_pair_2 = self.get_trading_pair_for_connector(token, connector_2)
-
                 # BUG FIX #16: Use safe_get_price instead of direct call to prevent TypeError crash
-                expected_price_1 = self.safe_get_price(connector_1, trading_pair_1, PriceType.MidPrice)
-                expected_price_2 = self.safe_get_price(connector_2, trading_pair_2, PriceType.MidPrice)
+                expected_price_1, expected_price_2 = self.get_pair_mid_prices(token, connector_1, connector_2)
 
                 if expected_price_1 is None or expected_price_2 is None:
                     self.logger().warning(f"Skipping {token}: Price unavailable for slippage check (C1: {expected_price_1}, C2: {expected_price_2})")
@@ -1256,21 +1564,35 @@ class FundingRateArbitrage(StrategyV2Base):
                     self.logger().warning(f"Skipping {token}: {depth_msg}")
                     continue
                 elif "OK" in depth_msg:
-                    self.logger().debug(f"{token}: {depth_msg}")
+                    self.logger().debug("%s: %s", token, depth_msg)
+
+                # Profitability is the most expensive check (fill prices for volume plus four fee lookups),
+                # so it runs only for candidates that passed the slippage and depth checks
+                current_profitability = self.get_current_profitability_after_fees(
+                    token, connector_1, connector_2, trade_side, position_size_quote
+                )
+                if current_profitability == _D_UNPROFITABLE:
+                    self.logger().warning(
+                        f"Skipping {token}: profitability calculation failed for {connector_1}/{connector_2}"
+                    )
+                    continue
 
-                if self.config.trade_profitability_condition_to_enter:
+                if require_trade_profit:
                     if current_profitability < 0:
-                        self.logger().info(f"Best Combination: {connector_1} | {connector_2} | {trade_side}"
-                                           f"Funding rate profitability: {expected_profitability}"
-                                           f"Trading profitability after fees: {current_profitability}"
-                                           f"Trade profitability is negative, skipping...")
+                        self.logger().info(
+                            "Best Combination: %s | %s | %s | Funding rate profitability: %s | "
+                            "Trading profitability after fees: %s | Trade profitability is negative, skipping...",
+                            connector_1, connector_2, trade_side, expected_profitability, current_profitability
+                        )
                         continue
-                self.logger().info(f"Best Combination: {connector_1} | {connector_2} | {trade_side}"
-                                   f"Funding rate profitability: {expected_profitability}"
-                                   f"Trading profitability after fees: {current_profitability}"
-                                   f"Starting executors...")
+                self.logger().info(
+                    "Best Combination: %s | %s | %s | Funding rate profitability: %s | "
+                    "Trading profitability after fees: %s | Starting executors...",
+                    connector_1, connector_2, trade_side, expected_profitability, current_profitability
+                )
                 position_executor_config_1, position_executor_config_2 = self.get_position_executors_config(
-                    token, connector_1, connector_2, trade_side, position_size_quote)
+                    token, connector_1, connector_2, trade_side, position_size_quote,
+                    prices=(expected_price_1, expected_price_2))
 
                 # Check if configs were created successfully
                 if position_executor_config_1 is None or position_executor_config_2 is None:
@@ -1284,24 +1606,37 @@ class FundingRateArbitrage(StrategyV2Base):
                     "connector_2": connector_2,
                     "executors_ids": [position_executor_config_1.id, position_executor_config_2.id],
                     "side": trade_side,
-                    "funding_payments": [],
+                    "funding_payments": deque(maxlen=100),
                     "position_size_quote": position_size_quote,
                     "timestamp": self.current_timestamp,  # Track when pending started
                     "validation_attempts": 0,
                     "last_validation_error": None,
                 }
+                self._track_position_connectors(self.pending_funding_arbitrages[token], 1)
 
                 self.logger().info(f"Position for {token} marked as PENDING. Awaiting validation after execution.")
 
                 # Add to create_actions list and continue checking other tokens
                 create_actions.extend([CreateExecutorAction(executor_config=position_executor_config_1),
                                       CreateExecutorAction(executor_config=position_executor_config_2)])
-                # Refresh available connectors to respect per-connector caps
-                available_connectors = self.get_available_connectors()
+                # Respect per-connector caps for the remaining tokens
+                if self._consume_available_connectors(available_connectors, connector_1, connector_2):
+                    filter_connectors = True
                 if len(available_connectors) < 2:
                     break  # No more available connector pairs
+        self._complete_scan(candidates)
         return create_actions
 
+    def _complete_scan(self, candidates: List[str]):
+        """
+        Start the rescan timer once an opportunity scan ran to the end. Funding rates move slowly, but the entry
+        checks (time to funding, balance, prices, slippage, depth, trade profitability) do not, so a scan that
+        rejected a token above the funding threshold leaves the timer alone and the token is retried next tick.
+        """
+        pending = self.pending_funding_arbitrages
+        if all(token in pending for token in candidates):
+            self._next_scan_ts = self.current_timestamp + self._scan_interval
+
     def _create_demo_positions(self) -> List[CreateExecutorAction]:
         """
         Demo mode: create simulated positions without placing real orders.
@@ -1311,25 +1646,34 @@ class FundingRateArbitrage(StrategyV2Base):
         if len(available_connectors) < 2:
             return create_actions
 
-        for token in self.config.tokens:
-            if (token in self.active_funding_arbitrages
-                    or token in self.pending_funding_arbitrages
-                    or token in self.closing_funding_arbitrages):
-                continue
-            funding_info_report = self.get_funding_info_by_token(token, available_connectors)
+        tokens_to_scan = [
+            token for token in self._tokens_tuple
+            if token not in self.active_funding_arbitrages
+            and token not in self.pending_funding_arbitrages
+            and token not in self.closing_funding_arbitrages
+        ]
+        funding_info_reports = self.get_tick_funding_reports(tokens_to_scan)
+        filter_connectors = len(available_connectors) < len(self._connectors_tuple)
+        min_profitability = self.config.min_funding_rate_profitability
+        candidates = []
+
+        for token in tokens_to_scan:
+            funding_info_report = funding_info_reports[token]
+            if filter_connectors:
+                # Drop connectors that reached their per-connector cap
+                funding_info_report = {
+                    connector_name: funding_info for connector_name, funding_info in funding_info_report.items()
+                    if connector_name in available_connectors
+                }
             if not funding_info_report or len(funding_info_report) < 2:
                 continue
             best_combination = self.get_most_profitable_combination(funding_info_report)
             if best_combination is None:
                 continue
             connector_1, connector_2, trade_side, expected_profitability = best_combination
-            if expected_profitability >= self.config.min_funding_rate_profitability:
-                position_size_quote = self.get_position_size_quote(connector_1, connector_2)
-                if position_size_quote <= 0:
-                    self.logger().warning(f"Skipping {token}: position_size_quote is zero or negative")
-                    continue
-
-                # SAFETY CHECK: Check time to next funding settlement
+            if expected_profitability >= min_profitability:
+                candidates.append(token)
+                # SAFETY CHECK: Check time to next funding settlement (snapshot only, so it runs first)
                 funding_time_ok, funding_time_msg = self.check_time_to_funding(
                     funding_info_report, connector_1, connector_2
                 )
@@ -1337,11 +1681,12 @@ class FundingRateArbitrage(StrategyV2Base):
                     self.logger().warning(f"Skipping {token}: {funding_time_msg}")
                     continue
 
-                trading_pair_1 = self.get_trading_pair_for_connector(token, connector_1)
-                trading_pair_2 = self.get_trading_pair_for_connector(token, connector_2)
+                position_size_quote = self.get_position_size_quote(connector_1, connector_2)
+                if position_size_quote <= 0:
+                    self.logger().warning(f"Skipping {token}: position_size_quote is zero or negative")
+                    continue
 
-                expected_price_1 = self.safe_get_price(connector_1, trading_pair_1, PriceType.MidPrice)
-                expected_price_2 = self.safe_get_price(connector_2, trading_pair_2, PriceType.MidPrice)
+                expected_price_1, expected_price_2 = self.get_pair_mid_prices(token, connector_1, connector_2)
 
                 if expected_price_1 is None or expected_price_2 is None:
                     self.logger().warning(
@@ -1368,7 +1713,7 @@ class FundingRateArbitrage(StrategyV2Base):
                     "connector_2": connector_2,
                     "executors_ids": [],
                     "side": trade_side,
-                    "funding_payments": [],
+                    "funding_payments": deque(maxlen=100),
                     "position_size_quote": position_size_quote,
                     "timestamp": self.current_timestamp,
                     "validation_attempts": 0,
@@ -1379,27 +1724,60 @@ class FundingRateArbitrage(StrategyV2Base):
                     "demo_filled_quote_1": position_size_quote,
                     "demo_filled_quote_2": position_size_quote,
                 }
+                self._track_position_connectors(self.pending_funding_arbitrages[token], 1)
 
                 self.logger().info(
                     f"DEMO position for {token} marked as PENDING. "
                     "Will simulate fills after delay."
                 )
 
-                available_connectors = self.get_available_connectors()
+                if self._consume_available_connectors(available_connectors, connector_1, connector_2):
+                    filter_connectors = True
                 if len(available_connectors) < 2:
                     break
 
+        self._complete_scan(candidates)
         return create_actions
 
+    def _log_position_opened(self, token: str, pending_info: dict, title: str, detail: str, time_pending: float):
+        """
+        Log the details of a position that moved from pending to active as one multi-line record.
+        The Decimal fields are only formatted when INFO records are actually emitted.
+        """
+        logger = self.logger()
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(
+            "\n".join((
+                "=" * 60,
+                " %s: %s",
+                "=" * 60,
+                " Position Details:",
+                "   - Token: %s",
+                "   - Exchange 1: %s",
+                "   - Exchange 2: %s",
+                "   - Side: %s",
+                "   - Position Size: $%s",
+                "   - %s",
+                "   - Time to validate: %.2fs",
+                " Active Positions: %d | Pending: %d",
+                "=" * 60,
+            )),
+            title, token, token, pending_info["connector_1"], pending_info["connector_2"], pending_info["side"],
+            pending_info["position_size_quote"], detail, time_pending,
+            len(self.active_funding_arbitrages), len(self.pending_funding_arbitrages),
+        )
+
     def validate_pending_positions(self) -> List[StopExecutorAction]:
         """
         CRITICAL: Validate pending positions before marking them as active.
         This prevents race condition where position is marked active before orders execute.
 
+        Processed positions are popped from pending_funding_arbitrages while iterating over a snapshot of it.
+
         Returns: List of StopExecutorAction for failed pending positions
         """
         stop_executor_actions = []
-        pending_to_remove = []
 
         for token, pending_info in list(self.pending_funding_arbitrages.items()):
             connector_1 = pending_info["connector_1"]
@@ -1409,25 +1787,13 @@ class FundingRateArbitrage(StrategyV2Base):
                 time_pending = self.current_timestamp - pending_info.get("timestamp", self.current_timestamp)
                 if time_pending < self.config.demo_fill_delay_seconds:
                     continue
-                pending_info["demo_accrued_funding_pnl"] = pending_info.get("demo_accrued_funding_pnl", Decimal("0"))
+                pending_info["demo_accrued_funding_pnl"] = pending_info.get("demo_accrued_funding_pnl", _D_ZERO)
                 self.active_funding_arbitrages[token] = pending_info
-                pending_to_remove.append(token)
-
-                self.logger().info("=" * 60)
-                self.logger().info(f" DEMO POSITION OPENED: {token}")
-                self.logger().info("=" * 60)
-                self.logger().info(" Position Details:")
-                self.logger().info(f"   - Token: {token}")
-                self.logger().info(f"   - Exchange 1: {connector_1}")
-                self.logger().info(f"   - Exchange 2: {connector_2}")
-                self.logger().info(f"   - Side: {pending_info['side']}")
-                self.logger().info(f"   - Position Size: ${pending_info['position_size_quote']}")
-                self.logger().info("   - Mode: DEMO (simulated fills)")
-                self.logger().info(f"   - Time to validate: {time_pending:.2f}s")
-                self.logger().info(
-                    f" Active Positions: {len(self.active_funding_arbitrages)} | Pending: {len(self.pending_funding_arbitrages) - 1}"
+                self.pending_funding_arbitrages.pop(token, None)
+
+                self._log_position_opened(
+                    token, pending_info, "DEMO POSITION OPENED", "Mode: DEMO (simulated fills)", time_pending
                 )
-                self.logger().info("=" * 60)
 
                 self.alerter.alert_position_opened(
                     token=token,
@@ -1452,17 +1818,14 @@ class FundingRateArbitrage(StrategyV2Base):
                     }
                 )
                 # Get executors and close them
-                executors = self.filter_executors(
-                    executors=self.get_all_executors(),
-                    filter_func=lambda x: x.id in pending_info["executors_ids"]
-                )
+                executors = self._get_active_executors_by_ids(pending_info["executors_ids"])
                 stop_executor_actions.extend([StopExecutorAction(executor_id=executor.id) for executor in executors])
                 self._mark_position_closing(
                     token,
                     pending_info,
                     f"Pending position timeout ({time_pending:.1f}s > {timeout_seconds}s)"
                 )
-                pending_to_remove.append(token)
+                self.pending_funding_arbitrages.pop(token, None)
                 continue
 
             # Validate position hedge
@@ -1471,22 +1834,12 @@ class FundingRateArbitrage(StrategyV2Base):
             if is_hedged:
                 # SUCCESS: Move to active
                 self.active_funding_arbitrages[token] = pending_info
-                pending_to_remove.append(token)
+                self.pending_funding_arbitrages.pop(token, None)
 
                 # BUG FIX #20: Enhanced logging for successful position opening
-                self.logger().info("=" * 60)
-                self.logger().info(f" POSITION OPENED SUCCESSFULLY: {token}")
-                self.logger().info("=" * 60)
-                self.logger().info(f" Position Details:")
-                self.logger().info(f"   - Token: {token}")
-                self.logger().info(f"   - Exchange 1: {connector_1}")
-                self.logger().info(f"   - Exchange 2: {connector_2}")
-                self.logger().info(f"   - Side: {pending_info['side']}")
-                self.logger().info(f"   - Position Size: ${pending_info['position_size_quote']}")
-                self.logger().info(f"   - Validation: {hedge_msg}")
-                self.logger().info(f"   - Time to validate: {self.current_timestamp - pending_info.get('timestamp', self.current_timestamp):.2f}s")
-                self.logger().info(f" Active Positions: {len(self.active_funding_arbitrages)} | Pending: {len(self.pending_funding_arbitrages) - 1}")
-                self.logger().info("=" * 60)
+                self._log_position_opened(
+                    token, pending_info, "POSITION OPENED SUCCESSFULLY", f"Validation: {hedge_msg}", time_pending
+                )
 
                 # Send success alert
                 self.alerter.alert_position_opened(
@@ -1532,21 +1885,14 @@ class FundingRateArbitrage(StrategyV2Base):
                     }
                 )
                 # Get executors and close them
-                executors = self.filter_executors(
-                    executors=self.get_all_executors(),
-                    filter_func=lambda x: x.id in pending_info["executors_ids"]
-                )
+                executors = self._get_active_executors_by_ids(pending_info["executors_ids"])
                 stop_executor_actions.extend([StopExecutorAction(executor_id=executor.id) for executor in executors])
                 self._mark_position_closing(
                     token,
                     pending_info,
                     f"Validation failed after retries: {hedge_msg}"
                 )
-                pending_to_remove.append(token)
-
-        # Remove processed pending positions
-        for token in pending_to_remove:
-            del self.pending_funding_arbitrages[token]
+                self.pending_funding_arbitrages.pop(token, None)
 
         return stop_executor_actions
 
@@ -1563,18 +1909,17 @@ class FundingRateArbitrage(StrategyV2Base):
             filled_quote_2 = pending_info.get("demo_filled_quote_2")
             if filled_quote_1 is None or filled_quote_2 is None:
                 return False, f"Demo filled quotes unavailable: {filled_quote_1}, {filled_quote_2}"
-            filled_quote_1 = Decimal(str(filled_quote_1))
-            filled_quote_2 = Decimal(str(filled_quote_2))
+            filled_quote_1 = _to_decimal(filled_quote_1)
+            filled_quote_2 = _to_decimal(filled_quote_2)
             if filled_quote_1 <= 0:
                 return False, f"{connector_1} demo position not filled yet: {filled_quote_1}"
             if filled_quote_2 <= 0:
                 return False, f"{connector_2} demo position not filled yet: {filled_quote_2}"
-            notional_1 = abs(filled_quote_1)
-            notional_2 = abs(filled_quote_2)
-            if notional_1 == 0 or notional_2 == 0:
-                return False, f"Zero notional value detected: {notional_1}, {notional_2}"
-            imbalance = abs(notional_1 - notional_2) / max(notional_1, notional_2)
-            if imbalance > self.config.max_position_imbalance_pct:
+            # Both fills were checked to be > 0 above, so they are the notionals as is
+            notional_1 = filled_quote_1
+            notional_2 = filled_quote_2
+            imbalance = self._imbalance_ratio(notional_1, notional_2)
+            if imbalance > self._max_imbalance_pct_f:
                 return False, (
                     f"Position imbalance {imbalance:.2%} > {self.config.max_position_imbalance_pct:.2%} "
                     f"(Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
@@ -1582,10 +1927,7 @@ class FundingRateArbitrage(StrategyV2Base):
             return True, f"Hedge OK: imbalance {imbalance:.2%} (Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
 
         # Get executors
-        executors = self.filter_executors(
-            executors=self.get_all_executors(),
-            filter_func=lambda x: x.id in pending_info["executors_ids"]
-        )
+        executors = self._get_active_executors_by_ids(pending_info["executors_ids"])
 
         if len(executors) != 2:
             return False, f"Expected 2 executors, found {len(executors)}"
@@ -1612,17 +1954,13 @@ class FundingRateArbitrage(StrategyV2Base):
         if filled_quote_2 is None or filled_quote_2 <= 0:
             return False, f"{connector_2} position not filled yet: {filled_quote_2}"
 
-        # Use quote notional directly to avoid price dependency
-        notional_1 = abs(filled_quote_1)
-        notional_2 = abs(filled_quote_2)
+        # Use quote notional directly to avoid price dependency; both fills were checked to be > 0 above
+        notional_1 = filled_quote_1
+        notional_2 = filled_quote_2
 
-        # Check imbalance
-        if notional_1 == 0 or notional_2 == 0:
-            return False, f"Zero notional value detected: {notional_1}, {notional_2}"
+        imbalance = self._imbalance_ratio(notional_1, notional_2)
 
-            imbalance = abs(notional_1 - notional_2) / max(notional_1, notional_2)
-
-        if imbalance > self.config.max_position_imbalance_pct:
+        if imbalance > self._max_imbalance_pct_f:
             return False, f"Position imbalance {imbalance:.2%} > {self.config.max_position_imbalance_pct:.2%} (Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
 
         return True, f"Hedge OK: imbalance {imbalance:.2%} (Q1: ${notional_1:.2f}, Q2: ${notional_2:.2f})"
@@ -1650,19 +1988,19 @@ class FundingRateArbitrage(StrategyV2Base):
             return
 
         if unrealized_pnl is None:
-            unrealized_pnl = Decimal("0")
+            unrealized_pnl = _D_ZERO
             for token, arb_info in self.active_funding_arbitrages.items():
                 if not arb_info.get("is_demo"):
                     continue
                 trade_pnl = self._calculate_demo_trade_pnl(token, arb_info)
                 if trade_pnl is None:
-                    trade_pnl = Decimal("0")
-                funding_pnl = arb_info.get("demo_accrued_funding_pnl", Decimal("0"))
-                unrealized_pnl += trade_pnl + Decimal(str(funding_pnl))
+                    trade_pnl = _D_ZERO
+                funding_pnl = arb_info.get("demo_accrued_funding_pnl", _D_ZERO)
+                unrealized_pnl += trade_pnl + _to_decimal(funding_pnl)
         else:
-            unrealized_pnl = Decimal(str(unrealized_pnl))
+            unrealized_pnl = _to_decimal(unrealized_pnl)
 
-        realized_pnl = Decimal(str(self.demo_realized_pnl))
+        realized_pnl = _to_decimal(self.demo_realized_pnl)
         equity = self.demo_start_balance + realized_pnl + unrealized_pnl
         total_pnl = realized_pnl + unrealized_pnl
 
@@ -1680,9 +2018,9 @@ class FundingRateArbitrage(StrategyV2Base):
 
         self.demo_last_metrics_ts = self.current_timestamp
 
-        max_drawdown_pct = Decimal("0")
+        max_drawdown_pct = _D_ZERO
         if max_equity > 0:
-            max_drawdown_pct = (self.demo_max_drawdown / max_equity) * Decimal("100")
+            max_drawdown_pct = (self.demo_max_drawdown / max_equity) * _D_HUNDRED
 
         self._ensure_demo_metrics_dir()
         write_header = not os.path.isfile(self.demo_metrics_file)
@@ -1727,10 +2065,7 @@ class FundingRateArbitrage(StrategyV2Base):
         if connector_1 is None or connector_2 is None:
             return None
 
-        trading_pair_1 = self.get_trading_pair_for_connector(token, connector_1)
-        trading_pair_2 = self.get_trading_pair_for_connector(token, connector_2)
-        current_price_1 = self.safe_get_price(connector_1, trading_pair_1, PriceType.MidPrice)
-        current_price_2 = self.safe_get_price(connector_2, trading_pair_2, PriceType.MidPrice)
+        current_price_1, current_price_2 = self.get_pair_mid_prices(token, connector_1, connector_2)
         if current_price_1 is None or current_price_2 is None:
             return None
 
@@ -1750,10 +2085,10 @@ class FundingRateArbitrage(StrategyV2Base):
         if filled_quote_2 is None:
             filled_quote_2 = position_size
 
-        entry_price_1 = Decimal(str(entry_price_1))
-        entry_price_2 = Decimal(str(entry_price_2))
-        filled_quote_1 = Decimal(str(filled_quote_1))
-        filled_quote_2 = Decimal(str(filled_quote_2))
+        entry_price_1 = _to_decimal(entry_price_1)
+        entry_price_2 = _to_decimal(entry_price_2)
+        filled_quote_1 = _to_decimal(filled_quote_1)
+        filled_quote_2 = _to_decimal(filled_quote_2)
 
         if entry_price_1 <= 0 or entry_price_2 <= 0 or filled_quote_1 <= 0 or filled_quote_2 <= 0:
             return None
@@ -1775,9 +2110,9 @@ class FundingRateArbitrage(StrategyV2Base):
     ) -> Decimal:
         accrued = info.get("demo_accrued_funding_pnl")
         if accrued is None:
-            accrued = Decimal("0")
+            accrued = _D_ZERO
         else:
-            accrued = Decimal(str(accrued))
+            accrued = _to_decimal(accrued)
         info["demo_accrued_funding_pnl"] = accrued
 
         if self.current_timestamp is None:
@@ -1786,7 +2121,7 @@ class FundingRateArbitrage(StrategyV2Base):
         position_size = info.get("position_size_quote")
         if position_size is None or position_size <= 0:
             return accrued
-        position_size = Decimal(str(position_size))
+        position_size = _to_decimal(position_size)
 
         connector_1 = info.get("connector_1")
         connector_2 = info.get("connector_2")
@@ -1809,7 +2144,7 @@ class FundingRateArbitrage(StrategyV2Base):
             if next_ts is None:
                 return
 
-            rate = Decimal(str(rate))
+            rate = _to_decimal(rate)
             while self.current_timestamp >= next_ts:
                 payment = (-rate if is_long else rate) * position_size
                 accrued += payment
@@ -1826,17 +2161,51 @@ class FundingRateArbitrage(StrategyV2Base):
         info["demo_accrued_funding_pnl"] = accrued
         return accrued
 
+    @staticmethod
+    def _sum_funding_payments(funding_payments) -> Decimal:
+        total = _D_ZERO
+        for funding_payment in funding_payments:
+            amount = funding_payment.amount
+            if amount is not None:
+                total += amount
+        return total
+
+    @staticmethod
+    def _sum_executors_pnl(executors) -> Decimal:
+        total = _D_ZERO
+        for executor in executors:
+            pnl = executor.net_pnl_quote
+            if pnl is not None:
+                total += pnl
+        return total
+
+    def _get_active_executors_by_ids(self, executor_ids: List[str]):
+        """
+        Get executors of the current controller reports by id.
+        The id -> executor map is rebuilt only when update_executors_info replaces controller_reports.
+        """
+        if self._executor_by_id_reports is not self.controller_reports:
+            self._executor_by_id = {executor.id: executor for executor in self.get_all_executors()}
+            self._executor_by_id_reports = self.controller_reports
+        executor_by_id = self._executor_by_id
+        return [executor_by_id[executor_id] for executor_id in executor_ids if executor_id in executor_by_id]
+
     def _get_executors_by_ids(self, executor_ids: List[str]):
         """
         Get executors by id, checking both active and archived executors.
         """
-        executors = [executor for executor in self.get_all_executors() if executor.id in executor_ids]
+        executors = self._get_active_executors_by_ids(executor_ids)
+        missing_ids = set(executor_ids).difference(executor.id for executor in executors)
         orchestrator = getattr(self, "executor_orchestrator", None)
-        if orchestrator is not None:
+        if missing_ids and orchestrator is not None:
+            # Only scan the archive for ids that are not among the active executors
             for archived_list in orchestrator.archived_executors.values():
                 for executor in archived_list:
-                    if executor.id in executor_ids and executor not in executors:
+                    if executor.id in missing_ids:
+                        missing_ids.discard(executor.id)
                         executors.append(executor)
+                if not missing_ids:
+                    break
         return executors
 
     def _mark_position_closing(
@@ -1850,7 +2219,8 @@ class FundingRateArbitrage(StrategyV2Base):
         """
         Track a position as closing so we can confirm it is fully closed.
         """
-        closing_info = dict(info)
+        self._hedge_cache.pop(token, None)
+        closing_info = info.copy()
         closing_info["close_reason"] = reason
         closing_info["close_timestamp"] = self.current_timestamp
         closing_info["last_close_alert_ts"] = None
@@ -1871,8 +2241,8 @@ class FundingRateArbitrage(StrategyV2Base):
 
             if closing_info.get("is_demo"):
                 if time_since_close >= self.config.demo_close_delay_seconds:
-                    demo_close_pnl = closing_info.get("demo_close_pnl", Decimal("0"))
-                    demo_close_pnl = Decimal(str(demo_close_pnl))
+                    demo_close_pnl = closing_info.get("demo_close_pnl", _D_ZERO)
+                    demo_close_pnl = _to_decimal(demo_close_pnl)
                     self.demo_realized_pnl += demo_close_pnl
                     total_pnl = float(demo_close_pnl)
                     close_reason = closing_info.get("close_reason", "Closed")
@@ -1882,9 +2252,8 @@ class FundingRateArbitrage(StrategyV2Base):
                         pnl=total_pnl,
                         reason=close_reason
                     )
-                    self.stopped_funding_arbitrages[token].append(closing_info)
-                    if len(self.stopped_funding_arbitrages[token]) > 10:
-                        self.stopped_funding_arbitrages[token] = self.stopped_funding_arbitrages[token][-10:]
+                    self.stopped_funding_arbitrages[token].append(StoppedArbitrage.from_closing_info(closing_info, total_pnl))
+                    self._track_position_connectors(closing_info, -1)
                     del self.closing_funding_arbitrages[token]
                     self._update_demo_metrics()
                 continue
@@ -1908,19 +2277,14 @@ class FundingRateArbitrage(StrategyV2Base):
                             "Time Since Close (s)": f"{time_since_close:.1f}",
                         }
                     )
+                    self._track_position_connectors(closing_info, -1)
                     del self.closing_funding_arbitrages[token]
                 continue
 
             all_closed = all(executor.is_done for executor in executors)
             if all_closed:
-                funding_payments_pnl = sum(
-                    funding_payment.amount if funding_payment.amount is not None else Decimal("0")
-                    for funding_payment in closing_info.get("funding_payments", [])
-                )
-                executors_pnl = sum(
-                    executor.net_pnl_quote if executor.net_pnl_quote is not None else Decimal("0")
-                    for executor in executors
-                )
+                funding_payments_pnl = self._sum_funding_payments(closing_info.get("funding_payments", []))
+                executors_pnl = self._sum_executors_pnl(executors)
                 total_pnl = float(executors_pnl + funding_payments_pnl)
                 close_reason = closing_info.get("close_reason", "Closed")
 
@@ -1931,9 +2295,8 @@ class FundingRateArbitrage(StrategyV2Base):
                     reason=close_reason
                 )
 
-                self.stopped_funding_arbitrages[token].append(closing_info)
-                if len(self.stopped_funding_arbitrages[token]) > 10:
-                    self.stopped_funding_arbitrages[token] = self.stopped_funding_arbitrages[token][-10:]
+                self.stopped_funding_arbitrages[token].append(StoppedArbitrage.from_closing_info(closing_info, total_pnl))
+                self._track_position_connectors(closing_info, -1)
                 del self.closing_funding_arbitrages[token]
                 continue
 
@@ -1970,8 +2333,10 @@ class FundingRateArbitrage(StrategyV2Base):
         """
         stop_executor_actions = []
 
-        # BUG FIX #20: Log periodic statistics
-        self.log_periodic_statistics()
+        # BUG FIX #20: Log periodic statistics (interval checked here so most ticks skip the call)
+        last_stats_log_time = self.last_stats_log_time
+        if last_stats_log_time is None or self.current_timestamp - last_stats_log_time >= self.stats_log_interval:
+            self.log_periodic_statistics()
 
         # CRITICAL: First validate pending positions
         pending_stop_actions = self.validate_pending_positions()
@@ -1981,18 +2346,25 @@ class FundingRateArbitrage(StrategyV2Base):
         closing_stop_actions = self.check_closing_positions()
         stop_executor_actions.extend(closing_stop_actions)
 
+        # Loop-invariant settings, read once per call
+        take_profit_ratio = self.config.profitability_to_take_profit
+        stop_loss_diff = self.config.funding_rate_diff_stop_loss
+        profitability_interval = self.funding_profitability_interval
+        validate_hedge = self.config.position_validation_enabled
+        emergency_close = self.config.emergency_close_on_imbalance
+
         tokens_to_remove = []
-        demo_unrealized_total = Decimal("0")
+        demo_unrealized_total = _D_ZERO
         demo_positions_seen = 0
         for token, funding_arbitrage_info in self.active_funding_arbitrages.items():
             connector_1 = funding_arbitrage_info["connector_1"]
             connector_2 = funding_arbitrage_info["connector_2"]
             is_demo = funding_arbitrage_info.get("is_demo", False)
             # SAFETY CHECK: Validate position hedge (continuous monitoring)
-            if self.config.position_validation_enabled:
+            if validate_hedge:
                 is_hedged, hedge_msg = self.validate_position_hedge(token)
                 if not is_hedged:
-                    if self.config.emergency_close_on_imbalance:
+                    if emergency_close:
                         self.logger().error(f"EMERGENCY CLOSE for {token}: {hedge_msg}")
 
                         # Send critical alert via Telegram
@@ -2008,7 +2380,7 @@ class FundingRateArbitrage(StrategyV2Base):
                         )
 
                         if is_demo:
-                            funding_info_report = self.get_funding_info_by_token(token)
+                            funding_info_report = self.get_tick_funding_reports((token,))[token]
                             funding_info_1 = funding_info_report.get(connector_1) if funding_info_report else None
                             funding_info_2 = funding_info_report.get(connector_2) if funding_info_report else None
                             funding_payments_pnl = self._update_demo_funding_pnl(
@@ -2016,32 +2388,25 @@ class FundingRateArbitrage(StrategyV2Base):
                             )
                             trade_pnl = self._calculate_demo_trade_pnl(token, funding_arbitrage_info)
                             if trade_pnl is None:
-                                trade_pnl = Decimal("0")
-                            demo_total_pnl = trade_pnl + funding_payments_pnl
-                            self._mark_position_closing(
-                                token,
-                                funding_arbitrage_info,
-                                f"EMERGENCY: {hedge_msg}",
-                                is_demo=True,
-                                demo_pnl=demo_total_pnl
+                                trade_pnl = _D_ZERO
+                            self._stop_arbitrage(
+                                token, funding_arbitrage_info, f"EMERGENCY: {hedge_msg}",
+                                stop_executor_actions, tokens_to_remove, demo_pnl=trade_pnl + funding_payments_pnl
                             )
-                            tokens_to_remove.append(token)
                             continue
 
-                        executors = self.filter_executors(
-                            executors=self.get_all_executors(),
-                            filter_func=lambda x: x.id in funding_arbitrage_info["executors_ids"]
+                        self._stop_arbitrage(
+                            token, funding_arbitrage_info, f"EMERGENCY: {hedge_msg}",
+                            stop_executor_actions, tokens_to_remove,
+                            executors=self._get_active_executors_by_ids(funding_arbitrage_info["executors_ids"])
                         )
-                        self._mark_position_closing(token, funding_arbitrage_info, f"EMERGENCY: {hedge_msg}")
-                        stop_executor_actions.extend([StopExecutorAction(executor_id=executor.id) for executor in executors])
-                        tokens_to_remove.append(token)
                         continue
                     else:
                         self.logger().warning(f"Position hedge warning for {token}: {hedge_msg}")
                 elif "Warning" in hedge_msg:
                     self.logger().warning(f"{token}: {hedge_msg}")
                 else:
-                    self.logger().debug(f"{token}: {hedge_msg}")
+                    self.logger().debug("%s: %s", token, hedge_msg)
 
             if is_demo:
                 position_size = funding_arbitrage_info.get("position_size_quote")
@@ -2049,121 +2414,58 @@ class FundingRateArbitrage(StrategyV2Base):
                     self.logger().error(f"Invalid position_size_quote for DEMO {token}: {position_size}")
                     continue
 
-                funding_info_report = self.get_funding_info_by_token(token)
+                funding_info_report = self.get_tick_funding_reports((token,))[token]
                 funding_info_1 = funding_info_report.get(connector_1) if funding_info_report else None
                 funding_info_2 = funding_info_report.get(connector_2) if funding_info_report else None
-                rate_connector_1 = self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_1)
-                rate_connector_2 = self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_2)
-                funding_rate_diff = None
-                current_funding_condition = False
-                if rate_connector_1 is None or rate_connector_2 is None:
-                    self.logger().warning(
-                        f"Funding rates unavailable for {token} on {connector_1}/{connector_2}; "
-                        "skipping funding-rate stop check"
-                    )
-                else:
-                    if funding_arbitrage_info["side"] == TradeType.BUY:
-                        funding_rate_diff = rate_connector_2 - rate_connector_1
-                    else:
-                        funding_rate_diff = rate_connector_1 - rate_connector_2
-                    current_funding_condition = (
-                        funding_rate_diff * self.funding_profitability_interval < self.config.funding_rate_diff_stop_loss
-                    )
-
                 funding_payments_pnl = self._update_demo_funding_pnl(
                     funding_arbitrage_info, funding_info_1, funding_info_2
                 )
                 trade_pnl = self._calculate_demo_trade_pnl(token, funding_arbitrage_info)
                 if trade_pnl is None:
                     self.logger().warning(f"DEMO PnL unavailable for {token}: price data missing")
-                    trade_pnl = Decimal("0")
+                    trade_pnl = _D_ZERO
 
                 demo_unrealized_total += trade_pnl + funding_payments_pnl
                 demo_positions_seen += 1
 
                 total_pnl = trade_pnl + funding_payments_pnl
                 take_profit_condition = total_pnl > (
-                    self.config.profitability_to_take_profit * position_size)
+                    take_profit_ratio * position_size)
 
                 if take_profit_condition:
-                    total_pnl_float = float(total_pnl)
-                    total_pnl_pct = (total_pnl_float / float(position_size)) * 100 if position_size > 0 else 0
-
-                    self.logger().info("=" * 60)
-                    self.logger().info(f" DEMO TAKE PROFIT REACHED: {token}")
-                    self.logger().info("=" * 60)
-                    self.logger().info(f" Position Details:")
-                    self.logger().info(f"   - Token: {token}")
-                    self.logger().info(f"   - Exchange 1: {connector_1}")
-                    self.logger().info(f"   - Exchange 2: {connector_2}")
-                    self.logger().info(f"   - Side: {funding_arbitrage_info['side']}")
-                    self.logger().info(f"   - Position Size: ${position_size}")
-                    self.logger().info(f" PnL Summary:")
-                    self.logger().info(f"   - Trading PnL: ${trade_pnl:.2f}")
-                    self.logger().info(f"   - Funding PnL (simulated): ${funding_payments_pnl:.2f}")
-                    self.logger().info(f"   - Total PnL: ${total_pnl_float:.2f} ({total_pnl_pct:+.2f}%)")
-                    self.logger().info(f"   - Funding Payments Collected: {len(funding_arbitrage_info['funding_payments'])}")
-                    self.logger().info(f" Active Positions: {len(self.active_funding_arbitrages) - 1}")
-                    self.logger().info("=" * 60)
-
-                    self._mark_position_closing(
-                        token,
-                        funding_arbitrage_info,
-                        "DEMO take profit target reached",
-                        is_demo=True,
-                        demo_pnl=total_pnl
+                    self._log_position_exit(
+                        "DEMO TAKE PROFIT REACHED", token, funding_arbitrage_info, position_size,
+                        trade_pnl, funding_payments_pnl, "Funding PnL (simulated)"
+                    )
+
+                    self._stop_arbitrage(
+                        token, funding_arbitrage_info, "DEMO take profit target reached",
+                        stop_executor_actions, tokens_to_remove, demo_pnl=total_pnl
                     )
-                    tokens_to_remove.append(token)
-                elif current_funding_condition:
-                    total_pnl_float = float(total_pnl)
-                    total_pnl_pct = (total_pnl_float / float(position_size)) * 100 if position_size > 0 else 0
-
-                    self.logger().info("=" * 60)
-                    self.logger().info(f" DEMO STOP LOSS TRIGGERED: {token}")
-                    self.logger().info("=" * 60)
-                    self.logger().info(f" Position Details:")
-                    self.logger().info(f"   - Token: {token}")
-                    self.logger().info(f"   - Exchange 1: {connector_1}")
-                    self.logger().info(f"   - Exchange 2: {connector_2}")
-                    self.logger().info(f"   - Side: {funding_arbitrage_info['side']}")
-                    self.logger().info(f"   - Position Size: ${position_size}")
-                    self.logger().info(f" Reason:")
-                    self.logger().info(f"   - Funding Rate Diff: {funding_rate_diff:.6f}")
-                    self.logger().info(f"   - Stop Loss Threshold: {self.config.funding_rate_diff_stop_loss:.6f}")
-                    self.logger().info(f" PnL Summary:")
-                    self.logger().info(f"   - Trading PnL: ${trade_pnl:.2f}")
-                    self.logger().info(f"   - Funding PnL (simulated): ${funding_payments_pnl:.2f}")
-                    self.logger().info(f"   - Total PnL: ${total_pnl_float:.2f} ({total_pnl_pct:+.2f}%)")
-                    self.logger().info(f"   - Funding Payments Collected: {len(funding_arbitrage_info['funding_payments'])}")
-                    self.logger().info(f" Active Positions: {len(self.active_funding_arbitrages) - 1}")
-                    self.logger().info("=" * 60)
-
-                    self._mark_position_closing(
-                        token,
-                        funding_arbitrage_info,
-                        "DEMO funding rate stop loss triggered",
-                        is_demo=True,
-                        demo_pnl=total_pnl
+                    continue
+
+                # The funding-rate stop is only evaluated when take profit did not trigger
+                funding_rate_diff = self._get_position_funding_rate_diff(token, funding_arbitrage_info)
+                if funding_rate_diff is not None and funding_rate_diff * profitability_interval < stop_loss_diff:
+                    self._log_position_exit(
+                        "DEMO STOP LOSS TRIGGERED", token, funding_arbitrage_info, position_size,
+                        trade_pnl, funding_payments_pnl, "Funding PnL (simulated)",
+                        stop_reason=(funding_rate_diff, stop_loss_diff)
+                    )
+
+                    self._stop_arbitrage(
+                        token, funding_arbitrage_info, "DEMO funding rate stop loss triggered",
+                        stop_executor_actions, tokens_to_remove, demo_pnl=total_pnl
                     )
-                    tokens_to_remove.append(token)
                 continue
 
-            executors = self.filter_executors(
-                executors=self.get_all_executors(),
-                filter_func=lambda x: x.id in funding_arbitrage_info["executors_ids"]
-            )
+            executors = self._get_active_executors_by_ids(funding_arbitrage_info["executors_ids"])
 
             # BUG FIX #9: Check if funding_payment.amount is None
-            funding_payments_pnl = sum(
-                funding_payment.amount if funding_payment.amount is not None else Decimal("0")
-                for funding_payment in funding_arbitrage_info["funding_payments"]
-            )
+            funding_payments_pnl = self._sum_funding_payments(funding_arbitrage_info["funding_payments"])
 
             # BUG FIX #8: Check if executor.net_pnl_quote is None
-            executors_pnl = sum(
-                executor.net_pnl_quote if executor.net_pnl_quote is not None else Decimal("0")
-                for executor in executors
-            )
+            executors_pnl = self._sum_executors_pnl(executors)
 
             # BUG FIX #11: Don't use default 0 for position_size_quote - it's dangerous!
             position_size = funding_arbitrage_info.get("position_size_quote")
@@ -2172,83 +2474,35 @@ class FundingRateArbitrage(StrategyV2Base):
                 continue
 
             take_profit_condition = executors_pnl + funding_payments_pnl > (
-                self.config.profitability_to_take_profit * position_size)
+                take_profit_ratio * position_size)
 
-            # Get funding info and compute funding-rate stop condition (if available)
-            funding_info_report = self.get_funding_info_by_token(token)
-            connector_1 = funding_arbitrage_info["connector_1"]
-            connector_2 = funding_arbitrage_info["connector_2"]
-            rate_connector_1 = self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_1)
-            rate_connector_2 = self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_2)
-            funding_rate_diff = None
-            current_funding_condition = False
-            if rate_connector_1 is None or rate_connector_2 is None:
-                self.logger().warning(
-                    f"Funding rates unavailable for {token} on {connector_1}/{connector_2}; "
-                    "skipping funding-rate stop check"
+            if take_profit_condition:
+                # BUG FIX #20: Enhanced logging for position closing
+                self._log_position_exit(
+                    "TAKE PROFIT REACHED", token, funding_arbitrage_info, position_size,
+                    executors_pnl, funding_payments_pnl, "Funding Payments"
                 )
-            else:
-                if funding_arbitrage_info["side"] == TradeType.BUY:
-                    funding_rate_diff = rate_connector_2 - rate_connector_1
-                else:
-                    funding_rate_diff = rate_connector_1 - rate_connector_2
-                current_funding_condition = (
-                    funding_rate_diff * self.funding_profitability_interval < self.config.funding_rate_diff_stop_loss
+
+                self._stop_arbitrage(
+                    token, funding_arbitrage_info, "Take profit target reached",
+                    stop_executor_actions, tokens_to_remove, executors=executors
                 )
+                continue
 
-            if take_profit_condition:
-                # BUG FIX #20: Enhanced logging for position closing
-                total_pnl = float(executors_pnl + funding_payments_pnl)
-                total_pnl_pct = (total_pnl / float(position_size)) * 100 if position_size > 0 else 0
-
-                self.logger().info("=" * 60)
-                self.logger().info(f" TAKE PROFIT REACHED: {token}")
-                self.logger().info("=" * 60)
-                self.logger().info(f" Position Details:")
-                self.logger().info(f"   - Token: {token}")
-                self.logger().info(f"   - Exchange 1: {connector_1}")
-                self.logger().info(f"   - Exchange 2: {connector_2}")
-                self.logger().info(f"   - Side: {funding_arbitrage_info['side']}")
-                self.logger().info(f"   - Position Size: ${position_size}")
-                self.logger().info(f" PnL Summary:")
-                self.logger().info(f"   - Trading PnL: ${executors_pnl:.2f}")
-                self.logger().info(f"   - Funding Payments: ${funding_payments_pnl:.2f}")
-                self.logger().info(f"   - Total PnL: ${total_pnl:.2f} ({total_pnl_pct:+.2f}%)")
-                self.logger().info(f"   - Funding Payments Collected: {len(funding_arbitrage_info['funding_payments'])}")
-                self.logger().info(f" Active Positions: {len(self.active_funding_arbitrages) - 1}")
-                self.logger().info("=" * 60)
-
-                self._mark_position_closing(token, funding_arbitrage_info, "Take profit target reached")
-                stop_executor_actions.extend([StopExecutorAction(executor_id=executor.id) for executor in executors])
-                tokens_to_remove.append(token)
-            elif current_funding_condition:
+            # The funding-rate stop is only evaluated when take profit did not trigger
+            funding_rate_diff = self._get_position_funding_rate_diff(token, funding_arbitrage_info)
+            if funding_rate_diff is not None and funding_rate_diff * profitability_interval < stop_loss_diff:
                 # BUG FIX #20: Enhanced logging for stop loss
-                total_pnl = float(executors_pnl + funding_payments_pnl)
-                total_pnl_pct = (total_pnl / float(position_size)) * 100 if position_size > 0 else 0
-
-                self.logger().info("=" * 60)
-                self.logger().info(f" STOP LOSS TRIGGERED: {token}")
-                self.logger().info("=" * 60)
-                self.logger().info(f" Position Details:")
-                self.logger().info(f"   - Token: {token}")
-                self.logger().info(f"   - Exchange 1: {connector_1}")
-                self.logger().info(f"   - Exchange 2: {connector_2}")
-                self.logger().info(f"   - Side: {funding_arbitrage_info['side']}")
-                self.logger().info(f"   - Position Size: ${position_size}")
-                self.logger().info(f" Reason:")
-                self.logger().info(f"   - Funding Rate Diff: {funding_rate_diff:.6f}")
-                self.logger().info(f"   - Stop Loss Threshold: {self.config.funding_rate_diff_stop_loss:.6f}")
-                self.logger().info(f" PnL Summary:")
-                self.logger().info(f"   - Trading PnL: ${executors_pnl:.2f}")
-                self.logger().info(f"   - Funding Payments: ${funding_payments_pnl:.2f}")
-                self.logger().info(f"   - Total PnL: ${total_pnl:.2f} ({total_pnl_pct:+.2f}%)")
-                self.logger().info(f"   - Funding Payments Collected: {len(funding_arbitrage_info['funding_payments'])}")
-                self.logger().info(f" Active Positions: {len(self.active_funding_arbitrages) - 1}")
-                self.logger().info("=" * 60)
-
-                self._mark_position_closing(token, funding_arbitrage_info, "Funding rate stop loss triggered")
-                stop_executor_actions.extend([StopExecutorAction(executor_id=executor.id) for executor in executors])
-                tokens_to_remove.append(token)
+                self._log_position_exit(
+                    "STOP LOSS TRIGGERED", token, funding_arbitrage_info, position_size,
+                    executors_pnl, funding_payments_pnl, "Funding Payments",
+                    stop_reason=(funding_rate_diff, stop_loss_diff)
+                )
+
+                self._stop_arbitrage(
+                    token, funding_arbitrage_info, "Funding rate stop loss triggered",
+                    stop_executor_actions, tokens_to_remove, executors=executors
+                )
 
         # Remove stopped arbitrages from active dict
         for token in tokens_to_remove:
@@ -2259,6 +2513,93 @@ class FundingRateArbitrage(StrategyV2Base):
 
         return stop_executor_actions
 
+    def _log_position_exit(
+            self,
+            title: str,
+            token: str,
+            funding_arbitrage_info: dict,
+            position_size: Decimal,
+            trade_pnl: Decimal,
+            funding_pnl: Decimal,
+            funding_label: str,
+            stop_reason: Tuple[Decimal, Decimal] | None = None
+    ):
+        """
+        Log a take profit or stop loss exit as one multi-line record. stop_reason is the (funding rate diff,
+        threshold) pair of a funding-rate stop. Nothing is formatted when INFO records are not emitted.
+        """
+        logger = self.logger()
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        total_pnl = float(trade_pnl + funding_pnl)
+        total_pnl_pct = (total_pnl / float(position_size)) * 100 if position_size > 0 else 0
+        lines = [
+            "=" * 60,
+            f" {title}: {token}",
+            "=" * 60,
+            " Position Details:",
+            f"   - Token: {token}",
+            f"   - Exchange 1: {funding_arbitrage_info['connector_1']}",
+            f"   - Exchange 2: {funding_arbitrage_info['connector_2']}",
+            f"   - Side: {funding_arbitrage_info['side']}",
+            f"   - Position Size: ${position_size}",
+        ]
+        if stop_reason is not None:
+            funding_rate_diff, stop_loss_diff = stop_reason
+            lines.append(" Reason:")
+            lines.append(f"   - Funding Rate Diff: {funding_rate_diff:.6f}")
+            lines.append(f"   - Stop Loss Threshold: {stop_loss_diff:.6f}")
+        lines.extend((
+            " PnL Summary:",
+            f"   - Trading PnL: ${trade_pnl:.2f}",
+            f"   - {funding_label}: ${funding_pnl:.2f}",
+            f"   - Total PnL: ${total_pnl:.2f} ({total_pnl_pct:+.2f}%)",
+            f"   - Funding Payments Collected: {len(funding_arbitrage_info['funding_payments'])}",
+            f" Active Positions: {len(self.active_funding_arbitrages) - 1}",
+            "=" * 60,
+        ))
+        logger.info("\n".join(lines))
+
+    def _stop_arbitrage(
+            self,
+            token: str,
+            funding_arbitrage_info: dict,
+            reason: str,
+            stop_executor_actions: List[StopExecutorAction],
+            tokens_to_remove: List[str],
+            executors=(),
+            demo_pnl: Decimal | None = None
+    ):
+        """
+        Move an active arbitrage to closing and queue stop actions for its executors. Demo positions have no
+        executors and record the simulated PnL instead. The caller drops tokens_to_remove from the active dict.
+        """
+        if funding_arbitrage_info.get("is_demo"):
+            self._mark_position_closing(token, funding_arbitrage_info, reason, is_demo=True, demo_pnl=demo_pnl)
+        else:
+            self._mark_position_closing(token, funding_arbitrage_info, reason)
+            stop_executor_actions.extend(StopExecutorAction(executor_id=executor.id) for executor in executors)
+        tokens_to_remove.append(token)
+
+    def _get_position_funding_rate_diff(self, token: str, funding_arbitrage_info: dict) -> Decimal | None:
+        """
+        Normalized funding rate spread earned by an open position (short leg minus long leg), or None when
+        either leg's rate is unavailable this tick.
+        """
+        connector_1 = funding_arbitrage_info["connector_1"]
+        connector_2 = funding_arbitrage_info["connector_2"]
+        rate_connector_1 = self.get_tick_normalized_funding_rate(token, connector_1)
+        rate_connector_2 = self.get_tick_normalized_funding_rate(token, connector_2)
+        if rate_connector_1 is None or rate_connector_2 is None:
+            self.logger().warning(
+                f"Funding rates unavailable for {token} on {connector_1}/{connector_2}; "
+                "skipping funding-rate stop check"
+            )
+            return None
+        if funding_arbitrage_info["side"] == TradeType.BUY:
+            return rate_connector_2 - rate_connector_1
+        return rate_connector_1 - rate_connector_2
+
     def log_periodic_statistics(self):
         """
         BUG FIX #20: Log periodic statistics about bot performance.
@@ -2273,20 +2614,23 @@ class FundingRateArbitrage(StrategyV2Base):
             return
 
         self.last_stats_log_time = self.current_timestamp
+        logger = self.logger()
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
         # Calculate total PnL and stats
         total_positions = len(self.active_funding_arbitrages)
         pending_positions = len(self.pending_funding_arbitrages)
         closing_positions = len(self.closing_funding_arbitrages)
         total_funding_payments = 0
-        total_pnl = Decimal("0")
+        total_pnl = _D_ZERO
 
         for token, arb_info in self.active_funding_arbitrages.items():
             if arb_info.get("is_demo"):
                 trade_pnl = self._calculate_demo_trade_pnl(token, arb_info)
                 if trade_pnl is None:
-                    trade_pnl = Decimal("0")
-                funding_payments_pnl = arb_info.get("demo_accrued_funding_pnl", Decimal("0"))
+                    trade_pnl = _D_ZERO
+                funding_payments_pnl = arb_info.get("demo_accrued_funding_pnl", _D_ZERO)
                 total_pnl += trade_pnl + funding_payments_pnl
                 continue
 
@@ -2294,44 +2638,38 @@ class FundingRateArbitrage(StrategyV2Base):
             total_funding_payments += len(arb_info["funding_payments"])
 
             # Calculate PnL for active positions
-            executors = self.filter_executors(
-                executors=self.get_all_executors(),
-                filter_func=lambda x: x.id in arb_info["executors_ids"]
-            )
+            executors = self._get_active_executors_by_ids(arb_info["executors_ids"])
 
-            funding_payments_pnl = sum(
-                funding_payment.amount if funding_payment.amount is not None else Decimal("0")
-                for funding_payment in arb_info["funding_payments"]
-            )
+            funding_payments_pnl = self._sum_funding_payments(arb_info["funding_payments"])
 
-            executors_pnl = sum(
-                executor.net_pnl_quote if executor.net_pnl_quote is not None else Decimal("0")
-                for executor in executors
-            )
+            executors_pnl = self._sum_executors_pnl(executors)
 
             total_pnl += executors_pnl + funding_payments_pnl
 
-        self.logger().info("=" * 80)
-        self.logger().info(" PERIODIC STATISTICS REPORT")
-        self.logger().info("=" * 80)
-        self.logger().info(f" Uptime: {time_since_last_log / 60:.1f} minutes since last report")
-        self.logger().info(f" Active Positions: {total_positions}")
-        self.logger().info(f" Pending Positions: {pending_positions}")
-        self.logger().info(f" Closing Positions: {closing_positions}")
-        self.logger().info(f" Total Unrealized PnL: ${float(total_pnl):.2f}")
-        self.logger().info(f" Total Funding Payments Collected: {total_funding_payments}")
+        lines = [
+            "=" * 80,
+            " PERIODIC STATISTICS REPORT",
+            "=" * 80,
+            f" Uptime: {time_since_last_log / 60:.1f} minutes since last report",
+            f" Active Positions: {total_positions}",
+            f" Pending Positions: {pending_positions}",
+            f" Closing Positions: {closing_positions}",
+            f" Total Unrealized PnL: ${float(total_pnl):.2f}",
+            f" Total Funding Payments Collected: {total_funding_payments}",
+        ]
         if total_positions > 0:
             avg_funding_per_position = total_funding_payments / total_positions
             avg_pnl_per_position = float(total_pnl) / total_positions
-            self.logger().info(f" Average per Position:")
-            self.logger().info(f"   - Funding Payments: {avg_funding_per_position:.1f}")
-            self.logger().info(f"   - Unrealized PnL: ${avg_pnl_per_position:.2f}")
-        self.logger().info(f" Rate Limiter Stats:")
+            lines.append(" Average per Position:")
+            lines.append(f"   - Funding Payments: {avg_funding_per_position:.1f}")
+            lines.append(f"   - Unrealized PnL: ${avg_pnl_per_position:.2f}")
+        lines.append(" Rate Limiter Stats:")
         for exchange_stats in self.rate_limiter.get_all_stats():
             if exchange_stats['requests_last_second'] > 0:
-                self.logger().info(f"   - {exchange_stats['exchange']}: {exchange_stats['requests_last_second']}/{exchange_stats['limit']} req/s ({exchange_stats['utilization']:.0f}%)")
-        self.logger().info(f"  Error Count (since last reset): {self.error_count}")
-        self.logger().info("=" * 80)
+                lines.append(f"   - {exchange_stats['exchange']}: {exchange_stats['requests_last_second']}/{exchange_stats['limit']} req/s ({exchange_stats['utilization']:.0f}%)")
+        lines.append(f"  Error Count (since last reset): {self.error_count}")
+        lines.append("=" * 80)
+        logger.info("\n".join(lines))
 
     def did_complete_funding_payment(self, funding_payment_completed_event: FundingPaymentCompletedEvent):
         """
@@ -2354,26 +2692,25 @@ class FundingRateArbitrage(StrategyV2Base):
             target_info = self.closing_funding_arbitrages[token]
 
         if target_info is not None:
+            # Prevent memory leak: the deque keeps only the last 100 payments
+            # (enough for ~4 days on Hyperliquid, ~33 days on OKX)
             target_info["funding_payments"].append(funding_payment_completed_event)
-            # Prevent memory leak: keep only last 100 payments (enough for ~4 days on Hyperliquid, ~33 days on OKX)
-            if len(target_info["funding_payments"]) > 100:
-                target_info["funding_payments"] = target_info["funding_payments"][-100:]
 
-    def get_position_executors_config(self, token, connector_1, connector_2, trade_side, position_size_quote: Decimal):
+    def get_position_executors_config(self, token, connector_1, connector_2, trade_side, position_size_quote: Decimal,
+                                      prices: Tuple[Decimal | None, Decimal | None] | None = None):
+        """
+        Build the executor configs of both legs. Callers that already fetched the leg mid prices this tick
+        can pass them as prices to skip the lookup.
+        """
         # BUG FIX #1: Use safe_get_price instead of direct call
         trading_pair_1 = self.get_trading_pair_for_connector(token, connector_1)
         trading_pair_2 = self.get_trading_pair_for_connector(token, connector_2)
 
-        price_1 = self.safe_get_price(connector_1, trading_pair_1, PriceType.MidPrice)
-        price_2 = self.safe_get_price(connector_2, trading_pair_2, PriceType.MidPrice)
-
-        if price_1 is None or price_2 is None:
-            self.logger().error(f"Price unavailable for {token} on {connector_1} or {connector_2}")
-            # Return fallback configs with zero amounts (will be rejected later)
-            return None, None
+        price_1, price_2 = prices if prices is not None else self.get_pair_mid_prices(token, connector_1, connector_2)
 
-        if price_1 <= 0 or price_2 <= 0:
-            self.logger().error(f"Invalid prices for {token}: {price_1}, {price_2}")
+        if price_1 is None or price_2 is None or price_1 <= 0 or price_2 <= 0:
+            # Configs are rejected by the caller
+            self.logger().error(f"Price unavailable or invalid for {token} on {connector_1}/{connector_2}: {price_1}, {price_2}")
             return None, None
 
         position_amount_1 = position_size_quote / price_1
@@ -2382,7 +2719,7 @@ class FundingRateArbitrage(StrategyV2Base):
         position_executor_config_1 = PositionExecutorConfig(
             timestamp=self.current_timestamp,
             connector_name=connector_1,
-            trading_pair=self.get_trading_pair_for_connector(token, connector_1),
+            trading_pair=trading_pair_1,
             side=trade_side,
             amount=position_amount_1,
             leverage=self.config.leverage,
@@ -2391,7 +2728,7 @@ class FundingRateArbitrage(StrategyV2Base):
         position_executor_config_2 = PositionExecutorConfig(
             timestamp=self.current_timestamp,
             connector_name=connector_2,
-            trading_pair=self.get_trading_pair_for_connector(token, connector_2),
+            trading_pair=trading_pair_2,
             side=TradeType.BUY if trade_side == TradeType.SELL else TradeType.SELL,
             amount=position_amount_2,
             leverage=self.config.leverage,
@@ -2400,15 +2737,39 @@ class FundingRateArbitrage(StrategyV2Base):
         return position_executor_config_1, position_executor_config_2
 
     def format_status(self) -> str:
+        active_tokens = tuple(sorted(self.active_funding_arbitrages))
+        cached = self._status_cache
+        if (cached is not None and cached[1] == active_tokens
+                and 0 <= self.current_timestamp - cached[0] < self._STATUS_TTL):
+            return cached[2]
+        status = self._build_status()
+        self._status_cache = (self.current_timestamp, active_tokens, status)
+        return status
+
+    def _build_status(self) -> str:
         original_status = super().format_status()
         funding_rate_status = []
         if self.ready_to_trade:
-            all_funding_info = []
-            all_best_paths = []
-            for token in self.config.tokens:
-                token_info = {"token": token}
-                best_paths_info = {"token": token}
-                funding_info_report = self.get_funding_info_by_token(token)
+            # Column-oriented buffers: pandas builds the frame in one pass
+            rate_columns = {
+                connector_name: f"{connector_name} Rate (%)" for connector_name in self._connectors_tuple
+            }
+            funding_cols = {"token": []}
+            funding_cols.update({column: [] for column in rate_columns.values()})
+            best_path_cols = {
+                "token": [],
+                "Best Path": [],
+                "Best Rate Diff (%)": [],
+                "Trade Profitability (%)": [],
+                "Days Trade Prof": [],
+                "Days to TP": [],
+                "Min to Funding 1": [],
+                "Min to Funding 2": [],
+            }
+            funding_info_reports = self.get_tick_funding_reports(self._tokens_tuple)
+            rate_to_pct = self.funding_profitability_interval * 100
+            for token in self._tokens_tuple:
+                funding_info_report = funding_info_reports[token]
 
                 # Skip if no funding info available
                 if not funding_info_report or len(funding_info_report) < 2:
@@ -2416,76 +2777,70 @@ class FundingRateArbitrage(StrategyV2Base):
 
                 best_combination = self.get_most_profitable_combination(funding_info_report)
 
-                # Add funding rates to token_info
-                for connector_name, info in funding_info_report.items():
-                    rate = self.get_normalized_funding_rate_in_seconds(funding_info_report, connector_name)
-                    token_info[f"{connector_name} Rate (%)"] = (
-                        rate * self.funding_profitability_interval * 100 if rate is not None else None
+                # Add funding rates for every configured connector (None when absent)
+                funding_cols["token"].append(token)
+                for connector_name, column in rate_columns.items():
+                    rate = (
+                        self.get_tick_normalized_funding_rate(token, connector_name)
+                        if connector_name in funding_info_report else None
                     )
+                    funding_cols[column].append(rate * rate_to_pct if rate is not None else None)
 
+                best_path_cols["token"].append(token)
                 # Skip if no profitable combination found
                 if best_combination is None:
-                    best_paths_info["Best Path"] = "N/A"
-                    best_paths_info["Best Rate Diff (%)"] = 0
-                    best_paths_info["Trade Profitability (%)"] = 0
-                    best_paths_info["Days Trade Prof"] = float('inf')
-                    best_paths_info["Days to TP"] = float('inf')
-                    best_paths_info["Min to Funding 1"] = 0
-                    best_paths_info["Min to Funding 2"] = 0
-                    all_funding_info.append(token_info)
-                    all_best_paths.append(best_paths_info)
+                    best_path_cols["Best Path"].append("N/A")
+                    best_path_cols["Best Rate Diff (%)"].append(0)
+                    best_path_cols["Trade Profitability (%)"].append(0)
+                    best_path_cols["Days Trade Prof"].append(float('inf'))
+                    best_path_cols["Days to TP"].append(float('inf'))
+                    best_path_cols["Min to Funding 1"].append(0)
+                    best_path_cols["Min to Funding 2"].append(0)
                     continue
 
                 connector_1, connector_2, side, funding_rate_diff = best_combination
                 position_size_quote = self.get_position_size_quote(connector_1, connector_2)
                 profitability_after_fees = self.get_current_profitability_after_fees(token, connector_1, connector_2, side, position_size_quote)
-                best_paths_info["Best Path"] = f"{connector_1}_{connector_2}"
-                best_paths_info["Best Rate Diff (%)"] = funding_rate_diff * 100
-                best_paths_info["Trade Profitability (%)"] = profitability_after_fees * 100
+                best_path_cols["Best Path"].append(f"{connector_1}_{connector_2}")
+                best_path_cols["Best Rate Diff (%)"].append(funding_rate_diff * 100)
+                best_path_cols["Trade Profitability (%)"].append(profitability_after_fees * 100)
                 # Protect against division by zero
-                if funding_rate_diff > Decimal("0.0001"):
-                    best_paths_info["Days Trade Prof"] = - profitability_after_fees / funding_rate_diff
-                    best_paths_info["Days to TP"] = (self.config.profitability_to_take_profit - profitability_after_fees) / funding_rate_diff
+                if funding_rate_diff > _D_MIN_DAILY_DIFF:
+                    best_path_cols["Days Trade Prof"].append(- profitability_after_fees / funding_rate_diff)
+                    best_path_cols["Days to TP"].append((self.config.profitability_to_take_profit - profitability_after_fees) / funding_rate_diff)
                 else:
-                    best_paths_info["Days Trade Prof"] = float('inf')
-                    best_paths_info["Days to TP"] = float('inf')
+                    best_path_cols["Days Trade Prof"].append(float('inf'))
+                    best_path_cols["Days to TP"].append(float('inf'))
 
                 # BUG FIX #10: Check if timestamp is None before operations
+                min_to_funding_1 = min_to_funding_2 = float('inf')
                 try:
                     next_funding_c1 = funding_info_report[connector_1].next_funding_utc_timestamp
                     next_funding_c2 = funding_info_report[connector_2].next_funding_utc_timestamp
 
                     if next_funding_c1 is not None and self.current_timestamp is not None:
-                        time_to_next_funding_info_c1 = next_funding_c1 - self.current_timestamp
-                        best_paths_info["Min to Funding 1"] = time_to_next_funding_info_c1 / 60
-                    else:
-                        best_paths_info["Min to Funding 1"] = float('inf')
+                        min_to_funding_1 = (next_funding_c1 - self.current_timestamp) / 60
 
                     if next_funding_c2 is not None and self.current_timestamp is not None:
-                        time_to_next_funding_info_c2 = next_funding_c2 - self.current_timestamp
-                        best_paths_info["Min to Funding 2"] = time_to_next_funding_info_c2 / 60
-                    else:
-                        best_paths_info["Min to Funding 2"] = float('inf')
+                        min_to_funding_2 = (next_funding_c2 - self.current_timestamp) / 60
                 except (TypeError, AttributeError) as e:
                     self.logger().warning(f"Error calculating time to next funding for {token}: {e}")
-                    best_paths_info["Min to Funding 1"] = float('inf')
-                    best_paths_info["Min to Funding 2"] = float('inf')
-
-                all_funding_info.append(token_info)
-                all_best_paths.append(best_paths_info)
+                    min_to_funding_1 = min_to_funding_2 = float('inf')
+                best_path_cols["Min to Funding 1"].append(min_to_funding_1)
+                best_path_cols["Min to Funding 2"].append(min_to_funding_2)
 
             funding_rate_status.append(f"\n\n\nMin Funding Rate Profitability: {self.config.min_funding_rate_profitability:.2%}")
             funding_rate_status.append(f"Profitability to Take Profit: {self.config.profitability_to_take_profit:.2%}\n")
             funding_rate_status.append("Funding Rate Info (Funding Profitability in Days): ")
 
             # BUG FIX #14: Check if lists are not empty before creating DataFrames
-            if all_funding_info:
-                funding_rate_status.append(format_df_for_printout(df=pd.DataFrame(all_funding_info), table_format="psql",))
+            if funding_cols["token"]:
+                funding_rate_status.append(format_df_for_printout(df=pd.DataFrame(funding_cols), table_format="psql",))
             else:
                 funding_rate_status.append("No funding info available")
 
-            if all_best_paths:
-                funding_rate_status.append(format_df_for_printout(df=pd.DataFrame(all_best_paths), table_format="psql",))
+            if best_path_cols["token"]:
+                funding_rate_status.append(format_df_for_printout(df=pd.DataFrame(best_path_cols), table_format="psql",))
             else:
                 funding_rate_status.append("No profitable paths found")
             for token, funding_arbitrage_info in self.active_funding_arbitrages.items():
@@ -2493,7 +2848,7 @@ class FundingRateArbitrage(StrategyV2Base):
                 short_connector = funding_arbitrage_info["connector_2"] if funding_arbitrage_info["side"] == TradeType.BUY else funding_arbitrage_info["connector_1"]
                 funding_rate_status.append(f"Token: {token}")
                 funding_rate_status.append(f"Long connector: {long_connector} | Short connector: {short_connector}")
-                funding_rate_status.append(f"Funding Payments Collected: {funding_arbitrage_info['funding_payments']}")
+                funding_rate_status.append(f"Funding Payments Collected: {list(funding_arbitrage_info['funding_payments'])}")
                 funding_rate_status.append(f"Executors: {funding_arbitrage_info['executors_ids']}")
                 funding_rate_status.append("-" * 50 + "\n")
         return original_status + "\n".join(funding_rate_status)
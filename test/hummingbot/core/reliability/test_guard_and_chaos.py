@@ -47,6 +47,22 @@ def test_reliability_can_trade_reasons_readiness(monkeypatch):
     assert ok is False and reason == "connections_critical"
 
 
+def test_status_snapshot_reports_rate_limits_and_breakers(monkeypatch):
+    rm = ReliabilityManager(ReliabilityConfig())
+    class RL:
+        def get_all_statuses(self):
+            return {"binance": {"tokens_available": 42.7, "capacity": 120}}
+    class CBM:
+        def can_trade(self):
+            return False
+    rm.rate_limiter = RL()
+    rm.circuit_breaker_manager = CBM()
+    snap = rm.get_status_snapshot()
+    assert snap.ready is False and snap.can_trade is False
+    assert snap.drift_ms == 0.0
+    assert snap.rate_limits == [("binance", 42, 120)]
+
+
 def test_trade_guard_blocks_strategy_buy(monkeypatch):
     # Patch global getter to return a RM that is not ready
     from hummingbot.core import reliability as reliability_mod
@@ -0,0 +1,451 @@
+import enum
+import importlib.util
+import logging
+import os
+import sys
+import types
+import unittest
+import uuid
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+# Lightweight stubs for the heavy modules the strategy script imports. They are only installed while the
+# script is loaded, so other tests in the session keep their own stubs or the real modules.
+
+
+class OrderType(enum.Enum):
+    MARKET = 1
+    LIMIT = 2
+
+
+class PositionAction(enum.Enum):
+    OPEN = "OPEN"
+    CLOSE = "CLOSE"
+
+
+class PositionMode(enum.Enum):
+    HEDGE = "HEDGE"
+    ONEWAY = "ONEWAY"
+
+
+class PriceType(enum.Enum):
+    MidPrice = 1
+
+
+class TradeType(enum.Enum):
+    BUY = 1
+    SELL = 2
+
+
+class FundingInfo:
+    def __init__(self, trading_pair, rate, next_funding_utc_timestamp):
+        self.trading_pair = trading_pair
+        self.rate = rate
+        self.next_funding_utc_timestamp = next_funding_utc_timestamp
+
+
+class StrategyV2Base:
+    def __init__(self, connectors, config=None):
+        self.connectors = connectors
+        self.config = config
+        self.controller_reports = {}
+        self.market_data_provider = MagicMock()
+        self._current_timestamp = 0
+        self.ready_to_trade = True
+
+    @property
+    def current_timestamp(self):
+        return self._current_timestamp
+
+    def get_all_executors(self):
+        return [executor for report in self.controller_reports.values() for executor in report["executors"]]
+
+    def logger(self):
+        return logging.getLogger("funding_rate_arb_test")
+
+
+class PositionExecutorConfig:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+        self.id = str(uuid.uuid4())
+
+
+class ExecutorAction:
+    def __init__(self, executor_config=None, executor_id=None):
+        self.executor_config = executor_config
+        self.executor_id = executor_id
+
+
+class RateLimiter:
+    def wait_if_needed(self, connector_name, block=True):
+        return 0.0
+
+    def get_all_stats(self):
+        return []
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+def _field(default=None, **kwargs):
+    return default
+
+
+_STUBS = {
+    "pandas": _module("pandas", DataFrame=MagicMock()),
+    "pydantic": _module("pydantic", Field=_field, field_validator=lambda *args, **kwargs: (lambda f: f)),
+    "hummingbot.client.ui.interface_utils": _module(
+        "hummingbot.client.ui.interface_utils", format_df_for_printout=MagicMock()),
+    "hummingbot.connector.connector_base": _module("hummingbot.connector.connector_base", ConnectorBase=object),
+    "hummingbot.core.clock": _module("hummingbot.core.clock", Clock=object),
+    "hummingbot.core.data_type.common": _module(
+        "hummingbot.core.data_type.common", OrderType=OrderType, PositionAction=PositionAction,
+        PositionMode=PositionMode, PriceType=PriceType, TradeType=TradeType),
+    "hummingbot.core.data_type.funding_info": _module(
+        "hummingbot.core.data_type.funding_info", FundingInfo=FundingInfo),
+    "hummingbot.core.event.events": _module(
+        "hummingbot.core.event.events", FundingPaymentCompletedEvent=object),
+    "hummingbot.data_feed.candles_feed.data_types": _module(
+        "hummingbot.data_feed.candles_feed.data_types", CandlesConfig=object),
+    "hummingbot.strategy.strategy_v2_base": _module(
+        "hummingbot.strategy.strategy_v2_base", StrategyV2Base=StrategyV2Base, StrategyV2ConfigBase=object),
+    "hummingbot.strategy_v2.executors.position_executor.data_types": _module(
+        "hummingbot.strategy_v2.executors.position_executor.data_types",
+        PositionExecutorConfig=PositionExecutorConfig, TripleBarrierConfig=lambda **kwargs: kwargs),
+    "hummingbot.strategy_v2.models.executor_actions": _module(
+        "hummingbot.strategy_v2.models.executor_actions",
+        CreateExecutorAction=ExecutorAction, StopExecutorAction=ExecutorAction),
+    "utils": _module("utils", TelegramAlerter=lambda *args, **kwargs: MagicMock(), get_rate_limiter=RateLimiter),
+}
+
+_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "scripts", "v2_funding_rate_arb.py")
+with patch.dict(sys.modules, _STUBS):
+    _spec = importlib.util.spec_from_file_location("_v2_funding_rate_arb_under_test", _SCRIPT_PATH)
+    funding_rate_arb = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(funding_rate_arb)
+
+CONNECTOR_1 = "binance_perpetual"
+CONNECTOR_2 = "bybit_perpetual"
+FUNDING_RATES = {CONNECTOR_1: Decimal("-0.002"), CONNECTOR_2: Decimal("0.003")}
+
+
+class OrderBookLevel:
+    amount = 1000.0
+
+
+class OrderBook:
+    def ask_entries(self):
+        return iter([OrderBookLevel()] * 20)
+
+    def bid_entries(self):
+        return iter([OrderBookLevel()] * 20)
+
+
+class Connector:
+    def __init__(self, strategy_clock, rate, trading_pairs):
+        self._clock = strategy_clock
+        self._rate = rate
+        self.trading_pairs = trading_pairs
+
+    def get_funding_info(self, trading_pair):
+        return FundingInfo(trading_pair, self._rate, self._clock() + 3600)
+
+    def get_order_book(self, trading_pair):
+        return OrderBook()
+
+    def get_available_balance(self, currency):
+        return Decimal("10000")
+
+    def get_fee(self, **kwargs):
+        return types.SimpleNamespace(percent=Decimal("0.0005"))
+
+
+class Executor:
+    def __init__(self, config):
+        self.id = config.id
+        self.connector_name = config.connector_name
+        self.filled_amount_quote = Decimal("100")
+        self.net_pnl_quote = Decimal("0")
+        self.is_done = False
+
+
+class FundingRateArbTestCase(unittest.TestCase):
+    def make_strategy(self, max_positions_per_connector: int = 0, funding_rates=None, tokens=("BTC", "ETH")):
+        funding_rates = FUNDING_RATES if funding_rates is None else funding_rates
+        config = types.SimpleNamespace(
+            connectors=set(funding_rates),
+            tokens=set(tokens),
+            leverage=20,
+            min_funding_rate_profitability=Decimal("0.001"),
+            position_size_quote=Decimal("100"),
+            position_size_quote_pct=Decimal("0"),
+            max_positions_per_connector=max_positions_per_connector,
+            profitability_to_take_profit=Decimal("0.01"),
+            funding_rate_diff_stop_loss=Decimal("-0.001"),
+            trade_profitability_condition_to_enter=False,
+            max_slippage_pct=Decimal("0.005"),
+            rate_limit_blocking=True,
+            position_validation_enabled=True,
+            pending_validation_timeout_seconds=10,
+            emergency_close_on_imbalance=True,
+            max_position_imbalance_pct=Decimal("0.1"),
+            min_time_to_next_funding_seconds=300,
+            min_order_book_depth_multiplier=Decimal("3"),
+            close_validation_timeout_seconds=60,
+            check_order_book_depth_enabled=True,
+            demo_mode=False,
+            demo_account_balance_quote=Decimal("10000"),
+            demo_fill_delay_seconds=2,
+            demo_close_delay_seconds=2,
+            demo_run_id="",
+            demo_metrics_enabled=False,
+            demo_metrics_file="",
+            demo_metrics_interval_seconds=60,
+        )
+        funding_rate_arb.FundingRateArbitrage.init_markets(config)
+        clock = lambda: strategy.current_timestamp  # noqa: E731
+        connectors = {
+            name: Connector(clock, rate, sorted(funding_rate_arb.FundingRateArbitrage.markets[name]))
+            for name, rate in funding_rates.items()
+        }
+        strategy = funding_rate_arb.FundingRateArbitrage(connectors, config)
+        strategy.market_data_provider.get_price_by_type.return_value = Decimal("100")
+        strategy.market_data_provider.get_price_for_quote_volume.return_value = types.SimpleNamespace(
+            result_price=Decimal("100"))
+        strategy._current_timestamp = 1000
+        self.executors = []
+        return strategy
+
+    def advance(self, strategy, seconds: float):
+        strategy._current_timestamp += seconds
+
+    def publish(self, strategy):
+        # A new reports object, as update_executors_info would produce on the next tick
+        strategy.controller_reports = {"main": {"executors": list(self.executors)}}
+
+    def open_positions(self, strategy):
+        actions = strategy.create_actions_proposal()
+        self.executors.extend(Executor(action.executor_config) for action in actions)
+        return actions
+
+
+class FundingRateArbConnectorRefcountTest(FundingRateArbTestCase):
+    def assert_counts_match_dict_walk(self, strategy):
+        # Position counts as they were recomputed from the pending, active and closing dicts
+        expected = {connector: 0 for connector in strategy.config.connectors}
+        for positions in (strategy.pending_funding_arbitrages, strategy.active_funding_arbitrages,
+                          strategy.closing_funding_arbitrages):
+            for info in positions.values():
+                expected[info["connector_1"]] += 1
+                expected[info["connector_2"]] += 1
+        self.assertEqual(expected, strategy.get_connector_position_counts())
+        cap = strategy.config.max_positions_per_connector
+        self.assertEqual(
+            {connector for connector, count in expected.items() if count < cap},
+            strategy.get_available_connectors()
+        )
+
+    def test_counts_follow_open_active_close_lifecycle(self):
+        for cap, expected_positions in ((1, 1), (2, 2)):
+            with self.subTest(max_positions_per_connector=cap):
+                strategy = self.make_strategy(cap)
+                self.assert_counts_match_dict_walk(strategy)
+
+                actions = self.open_positions(strategy)
+                self.assertEqual(2 * expected_positions, len(actions))
+                self.assertEqual(expected_positions, len(strategy.pending_funding_arbitrages))
+                self.assert_counts_match_dict_walk(strategy)
+
+                # Fills arrive: pending -> active
+                self.advance(strategy, 1)
+                self.publish(strategy)
+                strategy.stop_actions_proposal()
+                self.assertEqual(expected_positions, len(strategy.active_funding_arbitrages))
+                self.assert_counts_match_dict_walk(strategy)
+
+                # Take profit: active -> closing
+                for executor in self.executors:
+                    executor.net_pnl_quote = Decimal("10")
+                self.advance(strategy, 1)
+                self.publish(strategy)
+                strategy.stop_actions_proposal()
+                self.assertEqual(expected_positions, len(strategy.closing_funding_arbitrages))
+                self.assert_counts_match_dict_walk(strategy)
+
+                # Executors finish: closing -> removed, connectors are released
+                for executor in self.executors:
+                    executor.is_done = True
+                self.advance(strategy, 1)
+                self.publish(strategy)
+                strategy.stop_actions_proposal()
+                self.assertEqual({}, strategy.closing_funding_arbitrages)
+                self.assert_counts_match_dict_walk(strategy)
+                self.assertEqual({CONNECTOR_1: 0, CONNECTOR_2: 0}, strategy.get_connector_position_counts())
+
+    def test_counts_follow_pending_timeout_lifecycle(self):
+        for cap, expected_positions in ((1, 1), (2, 2)):
+            with self.subTest(max_positions_per_connector=cap):
+                strategy = self.make_strategy(cap)
+                self.open_positions(strategy)
+                self.assert_counts_match_dict_walk(strategy)
+
+                # No fills before the pending timeout: pending -> closing
+                self.advance(strategy, strategy.config.pending_validation_timeout_seconds + 1)
+                strategy.stop_actions_proposal()
+                self.assertEqual({}, strategy.pending_funding_arbitrages)
+                self.assertEqual(expected_positions, len(strategy.closing_funding_arbitrages))
+                self.assert_counts_match_dict_walk(strategy)
+
+                # The stopped executors report done: closing -> removed
+                for executor in self.executors:
+                    executor.is_done = True
+                self.advance(strategy, 1)
+                self.publish(strategy)
+                strategy.stop_actions_proposal()
+                self.assertEqual({}, strategy.closing_funding_arbitrages)
+                self.assert_counts_match_dict_walk(strategy)
+
+                # Both connectors are free again, so a new position can be admitted
+                self.advance(strategy, strategy._scan_interval)
+                self.assertEqual(2 * expected_positions, len(self.open_positions(strategy)))
+                self.assert_counts_match_dict_walk(strategy)
+
+
+class FundingRateArbScanTimerTest(FundingRateArbTestCase):
+    def test_completed_scan_gates_rescans_for_scan_interval(self):
+        # Equal rates: the scan completes without candidates and starts the timer
+        strategy = self.make_strategy(funding_rates={CONNECTOR_1: Decimal("0.001"), CONNECTOR_2: Decimal("0.001")})
+        with patch.object(strategy, "get_tick_funding_reports", wraps=strategy.get_tick_funding_reports) as scan:
+            self.assertEqual([], strategy.create_actions_proposal())
+            self.assertEqual(1, scan.call_count)
+            self.assertEqual(strategy.current_timestamp + strategy._scan_interval, strategy._next_scan_ts)
+
+            self.advance(strategy, strategy._scan_interval - 1)
+            self.assertEqual([], strategy.create_actions_proposal())
+            self.assertEqual(1, scan.call_count)
+
+            self.advance(strategy, 1)
+            strategy.create_actions_proposal()
+            self.assertEqual(2, scan.call_count)
+
+    def test_scan_without_free_connectors_does_not_start_timer(self):
+        strategy = self.make_strategy(max_positions_per_connector=1, tokens=("BTC",))
+        self.assertEqual(2, len(self.open_positions(strategy)))
+
+        # Both connectors are held by the pending position: every tick bails out before scanning
+        for _ in range(3):
+            self.advance(strategy, strategy._scan_interval)
+            next_scan_ts = strategy._next_scan_ts
+            self.assertEqual([], strategy.create_actions_proposal())
+            self.assertEqual(next_scan_ts, strategy._next_scan_ts)
+
+        # The position times out and is closed; the freed connectors are used on the very next tick
+        self.advance(strategy, strategy.config.pending_validation_timeout_seconds + 1)
+        strategy.stop_actions_proposal()
+        for executor in self.executors:
+            executor.is_done = True
+        self.advance(strategy, 1)
+        self.publish(strategy)
+        strategy.stop_actions_proposal()
+        self.assertEqual({}, strategy.closing_funding_arbitrages)
+
+        self.advance(strategy, 1)
+        self.assertEqual(2, len(self.open_positions(strategy)))
+
+    def test_rejected_candidate_does_not_start_timer(self):
+        strategy = self.make_strategy(tokens=("BTC",))
+        strategy.market_data_provider.get_price_by_type.return_value = None
+        self.assertEqual([], strategy.create_actions_proposal())
+        self.assertEqual(0, strategy._next_scan_ts)
+
+        # Prices are back on the next tick and the candidate is retried right away
+        strategy.market_data_provider.get_price_by_type.return_value = Decimal("100")
+        self.advance(strategy, 1)
+        self.assertEqual(2, len(self.open_positions(strategy)))
+        self.assertEqual(strategy.current_timestamp + strategy._scan_interval, strategy._next_scan_ts)
+
+
+class FundingRateArbBestCombinationTest(FundingRateArbTestCase):
+    HYPERLIQUID = "hyperliquid_perpetual"
+    OKX = "okx_perpetual"
+
+    def funding_report(self, strategy, rates):
+        return {
+            name: FundingInfo(strategy.get_trading_pair_for_connector("BTC", name), rate, 0)
+            for name, rate in rates.items()
+        }
+
+    def baseline_combination(self, strategy, report):
+        # Pairwise Decimal search over connectors sharing a quote currency, as before the min/max scan
+        best, best_diff = None, Decimal("0")
+        for connector_1 in report:
+            for connector_2 in report:
+                if connector_1 == connector_2:
+                    continue
+                if strategy.quote_markets_map[connector_1] != strategy.quote_markets_map[connector_2]:
+                    continue
+                rate_1 = strategy.get_normalized_funding_rate_in_seconds(report, connector_1)
+                rate_2 = strategy.get_normalized_funding_rate_in_seconds(report, connector_2)
+                if rate_1 is None or rate_2 is None:
+                    continue
+                diff = (rate_2 - rate_1) * strategy.funding_profitability_interval
+                if diff > best_diff:
+                    best, best_diff = (connector_1, connector_2), diff
+        return best, best_diff
+
+    def test_best_pair_is_chosen_within_one_quote_group(self):
+        rates = {
+            # USD venue with the most extreme rate: a cross-quote pair would have the widest spread
+            self.HYPERLIQUID: Decimal("-0.01"),
+            CONNECTOR_1: Decimal("0.001"),
+            CONNECTOR_2: Decimal("0.003"),
+            self.OKX: Decimal("0.002"),
+        }
+        strategy = self.make_strategy(funding_rates=rates)
+        report = self.funding_report(strategy, rates)
+
+        connector_min, connector_max, side, funding_rate_diff = strategy.get_most_profitable_combination(report)
+        self.assertEqual((CONNECTOR_1, CONNECTOR_2, TradeType.BUY), (connector_min, connector_max, side))
+        expected = (rates[CONNECTOR_2] / Decimal(8 * 60 * 60) - rates[CONNECTOR_1] / Decimal(8 * 60 * 60)) * \
+            strategy.funding_profitability_interval
+        self.assertEqual(expected, funding_rate_diff)
+        self.assertEqual(self.baseline_combination(strategy, report), ((connector_min, connector_max), funding_rate_diff))
+
+    def test_connector_with_none_rate_is_skipped(self):
+        rates = {CONNECTOR_1: Decimal("0.001"), CONNECTOR_2: None, self.OKX: Decimal("0.004")}
+        strategy = self.make_strategy(funding_rates=rates)
+        report = self.funding_report(strategy, rates)
+
+        connector_min, connector_max, side, funding_rate_diff = strategy.get_most_profitable_combination(report)
+        self.assertEqual((CONNECTOR_1, self.OKX, TradeType.BUY), (connector_min, connector_max, side))
+        self.assertEqual(self.baseline_combination(strategy, report), ((connector_min, connector_max), funding_rate_diff))
+
+    def test_equal_rates_return_none(self):
+        rates = {CONNECTOR_1: Decimal("0.002"), CONNECTOR_2: Decimal("0.002"), self.OKX: Decimal("0.002")}
+        strategy = self.make_strategy(funding_rates=rates)
+        self.assertIsNone(strategy.get_most_profitable_combination(self.funding_report(strategy, rates)))
+
+    def test_matches_pairwise_decimal_search(self):
+        rate_sets = (
+            {CONNECTOR_1: Decimal("-0.0003"), CONNECTOR_2: Decimal("0.00071"), self.OKX: Decimal("0.0001"),
+             self.HYPERLIQUID: Decimal("0.00002")},
+            {CONNECTOR_1: Decimal("0.0005"), CONNECTOR_2: Decimal("-0.0002"), self.OKX: Decimal("0.0009"),
+             self.HYPERLIQUID: Decimal("-0.0004")},
+            {CONNECTOR_1: Decimal("0.0001"), CONNECTOR_2: Decimal("0.0001"), self.OKX: Decimal("0.00010001")},
+        )
+        for rates in rate_sets:
+            with self.subTest(rates=rates):
+                strategy = self.make_strategy(funding_rates=rates)
+                report = self.funding_report(strategy, rates)
+                connector_min, connector_max, side, funding_rate_diff = strategy.get_most_profitable_combination(report)
+                self.assertEqual(TradeType.BUY, side)
+                self.assertEqual(
+                    self.baseline_combination(strategy, report), ((connector_min, connector_max), funding_rate_diff)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
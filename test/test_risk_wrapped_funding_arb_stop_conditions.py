@@ -88,6 +88,83 @@ class RiskWrappedFundingArbStopTest(unittest.TestCase):
                 self.strategy._check_stop_loss()
                 stop_mock.assert_called_once()
 
+    def test_stop_on_stale_ws(self):
+        stale = MagicMock()
+        stale.user_stream_tracker.data_source.last_recv_time = 10
+        no_tracker = object()
+        self.strategy.connectors = {"no_tracker": no_tracker, "stale": stale}
+        self.strategy._ws_last_recv_getters = None
+        self.strategy._set_current_timestamp(10 + self.strategy.WS_LATENCY_LIMIT_SEC + 1)
+        with patch.object(_dummy_app, 'stop') as stop_mock:
+            self.strategy._check_ws_latency()
+            stop_mock.assert_called_once()
+        # no_tracker was skipped at bind time, so the getters are not cached and it is probed again next tick
+        self.assertIsNone(self.strategy._ws_last_recv_getters)
+
+    def test_on_tick_resets_day_with_tick_timestamp(self):
+        self._set_pnl(Decimal("0"))
+        self.strategy._ws_last_recv_getters = []
+        self.strategy._set_current_timestamp(2 * 24 * 60 * 60)
+        self.strategy.on_tick()
+        self.assertEqual(2 * 24 * 60 * 60, self.strategy._day_start_ts)
+
+    def test_ws_getters_bound_once_across_same_day_ticks(self):
+        self._set_pnl(Decimal("0"))
+        fresh = MagicMock()
+        fresh.user_stream_tracker.data_source.last_recv_time = 1
+        self.strategy.connectors = {"fresh": fresh}
+        bind = self.strategy._bind_ws_last_recv_getters
+        with patch.object(self.strategy, '_bind_ws_last_recv_getters', side_effect=bind) as bind_spy:
+            for ts in range(1, 11):
+                self.strategy._set_current_timestamp(ts)
+                self.strategy.on_tick()
+        bind_spy.assert_called_once()
+
+    def test_on_tick_survives_raising_ws_getter(self):
+        self._set_pnl(Decimal("0"))
+        self.strategy._set_current_timestamp(100)
+        self.strategy.connectors = {}
+
+        def swapped_out():
+            raise AttributeError("'NoneType' object has no attribute 'last_recv_time'")
+
+        self.strategy._ws_last_recv_getters = [("swapped", swapped_out)]
+        with patch.object(_dummy_app, 'stop') as stop_mock:
+            self.strategy.on_tick()
+            stop_mock.assert_not_called()
+        self.assertIsNone(self.strategy._ws_last_recv_getters)
+
+    def test_unexpected_getter_error_does_not_skip_other_connectors(self):
+        self._set_pnl(Decimal("0"))
+        self.strategy._set_current_timestamp(10 + self.strategy.WS_LATENCY_LIMIT_SEC + 1)
+        self.strategy.connectors = {}
+
+        def broken():
+            raise RuntimeError("stream closed")
+
+        self.strategy._ws_last_recv_getters = [("broken", broken), ("stale", lambda: 10)]
+        with patch.object(_dummy_app, 'stop') as stop_mock:
+            self.strategy.on_tick()
+            stop_mock.assert_called_once()
+
+    def test_connector_skipped_at_bind_is_retried(self):
+        self._set_pnl(Decimal("0"))
+        late = MagicMock()
+        del late.user_stream_tracker
+        self.strategy.connectors = {"late": late}
+        self.strategy._set_current_timestamp(10 + self.strategy.WS_LATENCY_LIMIT_SEC + 1)
+        with patch.object(_dummy_app, 'stop') as stop_mock:
+            self.strategy.on_tick()
+            stop_mock.assert_not_called()
+            self.assertIsNone(self.strategy._ws_last_recv_getters)
+
+            # The user stream comes up later and is picked up by the next tick's bind
+            late.user_stream_tracker = MagicMock()
+            late.user_stream_tracker.data_source.last_recv_time = 10
+            self.strategy.on_tick()
+            stop_mock.assert_called_once()
+        self.assertEqual(["late"], [name for name, _ in self.strategy._ws_last_recv_getters])
+
 
 if __name__ == '__main__':
     unittest.main()